@@ -0,0 +1,174 @@
+import asyncio
+import datetime
+import os
+import platform
+import tempfile
+from importlib import metadata
+
+from markdownfeeds.Benchmarks.CorpusGenerator import CorpusGenerator
+from markdownfeeds.Generators import GeneratorSettings
+from markdownfeeds.Generators.Default.DefaultFeedGenerator import DefaultFeedGenerator
+from markdownfeeds.Generators.Html.HtmlFeedGenerator import HtmlFeedGenerator
+from markdownfeeds.Generators.Json.JsonFeedGenerator import JsonFeedGenerator
+from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
+
+
+class BenchmarkRunner:
+    """
+    Runs benchmarks of the feed generators against synthetic corpora, timing each stage of a generator run.
+    """
+
+    # Generators that can be benchmarked
+    GENERATORS = {
+        'json': JsonFeedGenerator,
+        'html': HtmlFeedGenerator,
+    }
+
+    def __init__(
+        self,
+        work_directory: str = None,
+        repeat: int = 1,
+        settings: dict = None
+    ):
+        """
+        Construct the benchmark runner.
+        :param work_directory: directory to write corpora and feeds to, defaults to a temporary directory
+        :param repeat: number of times to run each benchmark, the fastest run of each stage is reported
+        :param settings: extra generator settings to benchmark with
+        """
+        self.work_directory = work_directory
+        self.repeat = repeat
+        self.settings = settings if settings else {}
+
+    def run(
+        self,
+        total_posts: [int],
+        body_sizes: [str],
+        front_matter_shapes: [str],
+        generators: [str]
+    ) -> dict:
+        """
+        Run a benchmark for every combination of the provided corpus sizes, body sizes, front-matter shapes and
+        generators. Returns machine-readable results.
+        """
+        results = []
+
+        with tempfile.TemporaryDirectory(dir=self.work_directory) as work_directory:
+            for posts in total_posts:
+                for body_size in body_sizes:
+                    for front_matter_shape in front_matter_shapes:
+                        corpus_directory = os.path.join(work_directory, f'{posts}-{body_size}-{front_matter_shape}')
+                        CorpusGenerator(posts, body_size, front_matter_shape).generate(corpus_directory)
+
+                        for generator in generators:
+                            stages = self.run_generator(
+                                generator, corpus_directory, os.path.join(corpus_directory + '-feeds', generator))
+
+                            results.append({
+                                'generator': generator,
+                                'posts': posts,
+                                'body_size': body_size,
+                                'front_matter': front_matter_shape,
+                                'stages': stages,
+                                'total': sum(stages.values()),
+                            })
+
+        return {'environment': BenchmarkRunner.get_environment(), 'settings': self.settings, 'results': results}
+
+    def run_generator(
+        self,
+        generator: str,
+        source_directory: str,
+        target_directory: str
+    ) -> dict:
+        """
+        Benchmark a single generator against a corpus, returning the fastest time of each stage in seconds.
+        """
+        fastest = {}
+
+        for _ in range(self.repeat):
+            timings = self.time_stages(
+                BenchmarkRunner.GENERATORS[generator](
+                    feed=JsonFeed(title='Benchmark'),
+                    generator_settings=GeneratorSettings(
+                        source_directory=source_directory, target_directory=target_directory, **self.settings)))
+
+            fastest = {stage: min(timings[stage], fastest.get(stage, timings[stage])) for stage in timings}
+
+        return fastest
+
+    @staticmethod
+    def time_stages(
+        generator: DefaultFeedGenerator
+    ) -> dict:
+        """
+        Run a generator and return the wall time of each stage.
+        """
+        run_result = asyncio.run(generator.run())
+        return {stage: metrics.wall_time for stage, metrics in run_result.stages.items()}
+
+    @staticmethod
+    def compare(
+        baseline: dict,
+        current: dict
+    ) -> [dict]:
+        """
+        Compare two sets of benchmark results, returning the ratio of current to baseline time for each matching
+        benchmark. A ratio above 1 means the current run was slower.
+        """
+        def get_key(result: dict) -> tuple:
+            return result['generator'], result['posts'], result['body_size'], result['front_matter']
+
+        baseline_results = {get_key(result): result for result in baseline['results']}
+        comparisons = []
+
+        for result in current['results']:
+            baseline_result = baseline_results.get(get_key(result))
+
+            if not baseline_result:
+                continue
+
+            comparisons.append({
+                'generator': result['generator'],
+                'posts': result['posts'],
+                'body_size': result['body_size'],
+                'front_matter': result['front_matter'],
+                'stages': {
+                    stage: BenchmarkRunner.ratio(baseline_result['stages'].get(stage), result['stages'][stage])
+                    for stage in result['stages']
+                },
+                'total': BenchmarkRunner.ratio(baseline_result['total'], result['total']),
+            })
+
+        return comparisons
+
+    @staticmethod
+    def ratio(
+        baseline: float | None,
+        current: float
+    ) -> float | None:
+        """
+        Get the ratio between two timings.
+        """
+        if not baseline:
+            return None
+
+        return current / baseline
+
+    @staticmethod
+    def get_environment() -> dict:
+        """
+        Describe the environment the benchmarks ran in.
+        """
+        try:
+            version = metadata.version('markdownfeeds')
+        except metadata.PackageNotFoundError:
+            version = None
+
+        return {
+            'markdownfeeds': version,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        }
@@ -0,0 +1,173 @@
+import datetime
+import os
+import random
+
+from markdownfeeds import write_to_file
+
+
+class CorpusGenerator:
+    """
+    Generates a synthetic corpus of Markdown files, for benchmarking. The corpus is deterministic for a given seed, so
+    runs against the same settings are comparable.
+    """
+
+    # Number of paragraphs, lists, code blocks and tables in a body of each size
+    BODY_SIZES = {
+        'small': {'paragraphs': 1, 'lists': 0, 'code_blocks': 0, 'tables': 0},
+        'medium': {'paragraphs': 6, 'lists': 1, 'code_blocks': 1, 'tables': 0},
+        'large': {'paragraphs': 30, 'lists': 4, 'code_blocks': 3, 'tables': 2},
+    }
+
+    # Supported shapes of front-matter
+    FRONT_MATTER_SHAPES = ['minimal', 'typical', 'rich']
+
+    WORDS = [
+        'captain', 'starship', 'warp', 'nebula', 'quadrant', 'shields', 'phaser', 'transporter', 'bridge', 'engine',
+        'orbit', 'planet', 'sensor', 'signal', 'anomaly', 'crew', 'log', 'stardate', 'course', 'impulse', 'deflector',
+        'hull', 'torpedo', 'shuttle', 'away', 'team', 'science', 'officer', 'the', 'a', 'of', 'and', 'to', 'we', 'was',
+    ]
+
+    AUTHORS = ['Jean-Luc Picard', 'Kathryn Janeway', 'Benjamin Sisko', 'James T. Kirk', 'Jonathan Archer']
+
+    TAGS = ['exploration', 'diplomacy', 'combat', 'science', 'engineering', 'medical', 'first-contact', 'borg']
+
+    def __init__(
+        self,
+        total_posts: int = 1000,
+        body_size: str = 'medium',
+        front_matter_shape: str = 'typical',
+        seed: int = 0
+    ):
+        """
+        Construct the corpus generator.
+        :param total_posts:
+        :param body_size: one of "small", "medium" or "large"
+        :param front_matter_shape: one of "minimal", "typical" or "rich"
+        :param seed:
+        """
+        if body_size not in CorpusGenerator.BODY_SIZES:
+            raise ValueError(f'Unknown body size "{body_size}", must be one of "{list(CorpusGenerator.BODY_SIZES)}".')
+
+        if front_matter_shape not in CorpusGenerator.FRONT_MATTER_SHAPES:
+            raise ValueError(
+                f'Unknown front-matter shape "{front_matter_shape}", must be one of '
+                f'"{CorpusGenerator.FRONT_MATTER_SHAPES}".')
+
+        self.total_posts = total_posts
+        self.body_size = body_size
+        self.front_matter_shape = front_matter_shape
+        self.seed = seed
+
+    def generate(
+        self,
+        directory_path: str
+    ) -> [str]:
+        """
+        Write the corpus to a directory, returning the paths of the written files.
+        """
+        rand = random.Random(self.seed)
+        start_date = datetime.date(2000, 1, 1)
+        file_paths = []
+
+        for index in range(self.total_posts):
+            date = start_date + datetime.timedelta(days=index % 9000)
+            file_path = os.path.join(directory_path, f'{date.isoformat()}-post-{index}.md')
+
+            write_to_file(file_path, self.generate_post(rand, index, date))
+            file_paths.append(file_path)
+
+        return file_paths
+
+    def generate_post(
+        self,
+        rand: random.Random,
+        index: int,
+        date: datetime.date
+    ) -> str:
+        """
+        Generate the contents of a single post.
+        """
+        return f'---\n{self.generate_front_matter(rand, index, date)}---\n\n{self.generate_body(rand)}\n'
+
+    def generate_front_matter(
+        self,
+        rand: random.Random,
+        index: int,
+        date: datetime.date
+    ) -> str:
+        """
+        Generate the front-matter of a post, as YAML.
+        """
+        front_matter = f'title: "{CorpusGenerator.sentence(rand, 6).rstrip(".")} {index}"\n'
+
+        if self.front_matter_shape == 'minimal':
+            return front_matter
+
+        front_matter += f'author: "{rand.choice(CorpusGenerator.AUTHORS)}"\n'
+        front_matter += f'tags: [{", ".join(rand.sample(CorpusGenerator.TAGS, 3))}]\n'
+
+        if self.front_matter_shape == 'typical':
+            return front_matter
+
+        front_matter += f'date: "{date.isoformat()} {rand.randint(0, 23):02d}:{rand.randint(0, 59):02d}:00"\n'
+        front_matter += f'summary: "{CorpusGenerator.sentence(rand, 20)}"\n'
+        front_matter += f'image: "https://example.com/images/{index}.png"\n'
+        front_matter += f'categories:\n  - {rand.choice(CorpusGenerator.TAGS)}\n  - {rand.choice(CorpusGenerator.TAGS)}\n'
+        front_matter += f'location:\n  quadrant: "{rand.choice(["Alpha", "Beta", "Gamma", "Delta"])}"\n'
+        front_matter += f'  sector: {rand.randint(1, 999)}\n'
+
+        return front_matter
+
+    def generate_body(
+        self,
+        rand: random.Random
+    ) -> str:
+        """
+        Generate the Markdown body of a post.
+        """
+        shape = CorpusGenerator.BODY_SIZES[self.body_size]
+        blocks = [CorpusGenerator.paragraph(rand) for _ in range(shape['paragraphs'])]
+
+        for _ in range(shape['lists']):
+            blocks.insert(
+                rand.randint(0, len(blocks)),
+                '\n'.join(f'* {CorpusGenerator.sentence(rand, 8)}' for _ in range(rand.randint(3, 8))))
+
+        for _ in range(shape['code_blocks']):
+            blocks.insert(
+                rand.randint(0, len(blocks)),
+                '```python\n' + '\n'.join(f'{rand.choice(CorpusGenerator.WORDS)} = {rand.randint(0, 999)}'
+                                          for _ in range(rand.randint(3, 12))) + '\n```')
+
+        for _ in range(shape['tables']):
+            rows = [f'| {rand.choice(CorpusGenerator.WORDS)} | {rand.randint(0, 999)} |' for _ in range(5)]
+            blocks.insert(rand.randint(0, len(blocks)), '| Name | Value |\n|------|-------|\n' + '\n'.join(rows))
+
+        if len(blocks) > 1:
+            blocks.insert(1, f'## {CorpusGenerator.sentence(rand, 4).rstrip(".")}')
+
+        return '\n\n'.join(blocks)
+
+    @staticmethod
+    def paragraph(
+        rand: random.Random
+    ) -> str:
+        """
+        Generate a paragraph of random sentences.
+        """
+        return ' '.join(CorpusGenerator.sentence(rand, rand.randint(6, 20)) for _ in range(rand.randint(2, 6)))
+
+    @staticmethod
+    def sentence(
+        rand: random.Random,
+        length: int
+    ) -> str:
+        """
+        Generate a sentence of random words.
+        """
+        words = [rand.choice(CorpusGenerator.WORDS) for _ in range(length)]
+
+        if rand.random() < .2:
+            words[rand.randrange(length)] = f'**{rand.choice(CorpusGenerator.WORDS)}**'
+
+        return ' '.join(words).capitalize() + '.'
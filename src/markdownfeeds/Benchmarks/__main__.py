@@ -0,0 +1,34 @@
+import argparse
+import json
+import logging
+
+from markdownfeeds import write_to_file, read_from_file
+from markdownfeeds.Benchmarks.BenchmarkRunner import BenchmarkRunner
+from markdownfeeds.Benchmarks.CorpusGenerator import CorpusGenerator
+
+parser = argparse.ArgumentParser(
+    prog='python -m markdownfeeds.Benchmarks',
+    description='Benchmark the feed generators against synthetic Markdown corpora.')
+parser.add_argument('--posts', type=int, nargs='+', default=[1000], help='corpus sizes, e.g. 1000 10000 100000')
+parser.add_argument('--body-sizes', nargs='+', default=['medium'], choices=list(CorpusGenerator.BODY_SIZES))
+parser.add_argument('--front-matter', nargs='+', default=['typical'], choices=CorpusGenerator.FRONT_MATTER_SHAPES)
+parser.add_argument('--generators', nargs='+', default=['json', 'html'], choices=list(BenchmarkRunner.GENERATORS))
+parser.add_argument('--repeat', type=int, default=1, help='runs per benchmark, the fastest time is reported')
+parser.add_argument('--settings', type=json.loads, default={}, help='extra generator settings, as a JSON object')
+parser.add_argument('--work-directory', help='directory for corpora and feeds, defaults to a temporary directory')
+parser.add_argument('--output', help='file to write the JSON results to, defaults to stdout')
+parser.add_argument('--compare', help='JSON results of a previous run to compare against')
+arguments = parser.parse_args()
+
+logging.basicConfig(level=logging.WARNING)
+
+results = BenchmarkRunner(arguments.work_directory, arguments.repeat, arguments.settings).run(
+    arguments.posts, arguments.body_sizes, arguments.front_matter, arguments.generators)
+
+if arguments.compare:
+    results['comparison'] = BenchmarkRunner.compare(json.loads(read_from_file(arguments.compare)), results)
+
+if arguments.output:
+    write_to_file(arguments.output, json.dumps(results, indent=2))
+else:
+    print(json.dumps(results, indent=2))
@@ -0,0 +1,222 @@
+import copy
+import logging
+import os
+import pickle
+import threading
+
+from markdownfeeds.MarkdownFile import MarkdownFile
+from markdownfeeds.MarkdownRenderer import MarkdownRenderer
+from markdownfeeds.MarkdownSummarizer import MarkdownSummarizer
+
+logging = logging.getLogger(__name__)
+
+
+class BuildCache:
+    """
+    A persistent, on-disk cache of parsed markdown files. Each entry stores the front-matter, body and derived values
+    (id, date, summary and, if it has been rendered, html) of a source file, along with the file's stat details and
+    content hash. Entries are reused for as long as the source file has not changed, so rebuilds only need to read and
+    parse changed files.
+
+    Front-matter is copied into and out of the cache, so changes made to a markdown file while processing it are
+    never stored in the cache, or seen by later builds.
+    """
+
+    # Bump this when the layout of a cache entry changes, older caches will then be discarded
+    CACHE_VERSION = 3
+
+    def __init__(
+        self,
+        cache_file_path: str = None
+    ):
+        """
+        Construct the build cache. If no cache file path is provided, the cache will only live in memory.
+        :param cache_file_path:
+        """
+        self.cache_file_path = cache_file_path
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if cache_file_path:
+            self.entries = BuildCache.read_entries(cache_file_path)
+
+    def load(
+        self,
+        file_path: str,
+        renderer: MarkdownRenderer = None,
+        summarizer: MarkdownSummarizer = None
+    ) -> MarkdownFile | None:
+        """
+        Restore a markdown file from the cache. Returns None if the file is not cached, has changed since it was cached
+        or its derived values were computed by a different markdown renderer or summarizer. A file is considered
+        unchanged if its modification time and size match, or failing that, if the hash of its contents match.
+        :param file_path:
+        :param renderer:
+        :param summarizer:
+        :return:
+        """
+        entry = self.entries.get(BuildCache.get_key(file_path))
+
+        if entry is None or not os.path.isfile(file_path):
+            self.misses += 1
+            return None
+
+        # The cached html and summary are only valid for the renderer and summarizer that computed them
+        if entry['derivation'] != BuildCache.get_derivation(renderer, summarizer):
+            self.misses += 1
+            return None
+
+        stat = os.stat(file_path)
+
+        if (stat.st_mtime_ns, stat.st_size) != entry['stat']:
+            if BuildCache.hash_file(file_path) != entry['hash']:
+                self.misses += 1
+                return None
+
+            # The file was touched but its contents are the same, so just refresh the stat details
+            entry['stat'] = (stat.st_mtime_ns, stat.st_size)
+
+        self.hits += 1
+
+        front_matter = copy.deepcopy(entry['front_matter'])
+
+        return MarkdownFile(file_path, front_matter, entry['body'], dict(entry['derived']), renderer, summarizer)
+
+    def store(
+        self,
+        file_path: str,
+        markdown_file: MarkdownFile
+    ) -> None:
+        """
+        Store a markdown file in the cache. The stat details and hash of the file are taken from the source of the
+        markdown file, when it was loaded with MarkdownFile.load(), so they describe the contents that were parsed
+        even if the file has been saved since.
+        :param file_path:
+        :param markdown_file:
+        :return:
+        """
+        if not os.path.isfile(file_path):
+            return
+
+        if markdown_file.source:
+            stat_details, content_hash = markdown_file.source
+        else:
+            stat = os.stat(file_path)
+            stat_details, content_hash = (stat.st_mtime_ns, stat.st_size), BuildCache.hash_file(file_path)
+
+        entry = {
+            'stat': stat_details,
+            'hash': content_hash,
+            'front_matter': copy.deepcopy(markdown_file.front_matter),
+            'body': markdown_file.body,
+            'derived': markdown_file.precompute(),
+            'derivation': BuildCache.get_derivation(markdown_file.renderer, markdown_file.summarizer),
+        }
+
+        with self._lock:
+            self.entries[BuildCache.get_key(file_path)] = entry
+
+    def prune(
+        self,
+        file_paths: list
+    ) -> None:
+        """
+        Remove any entries for files that are not in the provided list, such as files that have been deleted.
+        :param file_paths:
+        :return:
+        """
+        keep = {BuildCache.get_key(file_path) for file_path in file_paths}
+
+        with self._lock:
+            self.entries = {key: entry for key, entry in self.entries.items() if key in keep}
+
+    def save(
+        self
+    ) -> None:
+        """
+        Persist the cache to disk.
+        :return:
+        """
+        if not self.cache_file_path:
+            return
+
+        dir_path = os.path.dirname(self.cache_file_path)
+
+        if dir_path and not os.path.exists(dir_path):
+            os.makedirs(dir_path)
+
+        temporary_file_path = f'{self.cache_file_path}.tmp'
+
+        with self._lock:
+            with open(temporary_file_path, 'wb') as file:
+                pickle.dump({'version': BuildCache.CACHE_VERSION, 'entries': self.entries}, file)
+
+            os.replace(temporary_file_path, self.cache_file_path)
+
+        logging.info(f'Saved build cache with {len(self.entries)} entries to "{self.cache_file_path}".')
+
+    @staticmethod
+    def read_entries(
+        cache_file_path: str
+    ) -> dict:
+        """
+        Read cache entries from disk. A missing, unreadable or outdated cache is treated as empty.
+        :param cache_file_path:
+        :return:
+        """
+        if not os.path.isfile(cache_file_path):
+            return {}
+
+        try:
+            with open(cache_file_path, 'rb') as file:
+                cache = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError) as error:
+            logging.warning(f'Ignoring unreadable build cache "{cache_file_path}": {error}')
+            return {}
+
+        if type(cache) is not dict or cache.get('version') != BuildCache.CACHE_VERSION:
+            logging.info(f'Ignoring outdated build cache "{cache_file_path}".')
+            return {}
+
+        return cache['entries']
+
+    @staticmethod
+    def get_key(
+        file_path: str
+    ) -> str:
+        """
+        Get the cache key for a file path.
+        :param file_path:
+        :return:
+        """
+        return os.path.abspath(file_path)
+
+    @staticmethod
+    def get_derivation(
+        renderer: MarkdownRenderer = None,
+        summarizer: MarkdownSummarizer = None
+    ) -> tuple:
+        """
+        Describe how the derived values of a markdown file are computed, the defaults are used if no renderer or
+        summarizer is provided.
+        :param renderer:
+        :param summarizer:
+        :return:
+        """
+        return (
+            (renderer if renderer else MarkdownRenderer.get()).backend,
+            (summarizer if summarizer else MarkdownFile.DEFAULT_SUMMARIZER).key)
+
+    @staticmethod
+    def hash_file(
+        file_path: str
+    ) -> str:
+        """
+        Hash the contents of a file.
+        :param file_path:
+        :return:
+        """
+        with open(file_path, 'rb') as file:
+            return MarkdownFile.hash_content(file.read())
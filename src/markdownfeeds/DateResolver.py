@@ -0,0 +1,81 @@
+import datetime
+import re
+from functools import lru_cache
+
+from dateutil import parser
+
+from markdownfeeds.Exceptions import DateParseError
+
+
+class DateResolver:
+    """
+    Resolves the date of a markdown file from a front-matter value or the file name.
+
+    YAML already parses unquoted dates, so native date and datetime values are used as they are. Strings are parsed
+    with datetime.fromisoformat first, which handles the common ISO 8601 formats far faster than dateutil, and only
+    fall back to dateutil for anything else. Parsed strings are cached, as datetimes are immutable and the same date
+    strings often appear in many files.
+    """
+
+    # Dates within file names, such as "2024-01-31-my-post.md"
+    FILE_NAME_PATTERN = re.compile(r'(\d+-\d+-\d+)')
+
+    @staticmethod
+    def resolve(
+        front_matter_date: any = None,
+        file_name: str = ''
+    ) -> datetime.datetime | None:
+        """
+        Resolve a date, from a front-matter value or failing that from a file name. Returns None if neither has a date,
+        and raises a DateParseError if a date cannot be parsed.
+        :param front_matter_date:
+        :param file_name:
+        :return:
+        """
+        date = front_matter_date if front_matter_date else DateResolver.find_in_file_name(file_name)
+
+        if not date:
+            return None
+
+        if isinstance(date, datetime.datetime):
+            return date
+
+        if isinstance(date, datetime.date):
+            return datetime.datetime(date.year, date.month, date.day)
+
+        if not isinstance(date, str):
+            raise TypeError(f'Unable to parse a date from a value of type "{type(date).__name__}".')
+
+        return DateResolver.parse(date)
+
+    @staticmethod
+    def find_in_file_name(
+        file_name: str
+    ) -> str | None:
+        """
+        Find a date within a file name.
+        :param file_name:
+        :return:
+        """
+        date_match = DateResolver.FILE_NAME_PATTERN.search(file_name)
+        return date_match[0] if date_match else None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def parse(
+        date: str
+    ) -> datetime.datetime:
+        """
+        Parse a date string, trying the ISO 8601 fast path before dateutil.
+        :param date:
+        :return:
+        """
+        try:
+            return datetime.datetime.fromisoformat(date)
+        except ValueError:
+            pass
+
+        try:
+            return parser.parse(date)
+        except (ValueError, OverflowError):
+            raise DateParseError('Unable to parse the date from the front-matter, incorrect format.')
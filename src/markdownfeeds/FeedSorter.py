@@ -0,0 +1,107 @@
+import datetime
+import heapq
+from operator import itemgetter
+
+from markdownfeeds.MarkdownFile import MarkdownFile
+
+
+class FeedSorter:
+    """
+    Sorts the items of a feed by the date, title or any other front-matter value of their markdown files. The sort
+    key of each item is computed once, rather than in every comparison. Items without a value are placed last, in
+    both orders, and items with equal values keep their original order.
+
+    Values of different types are never compared with each other: numbers sort before dates, dates before strings and
+    strings before any other value, which is compared as a string. Dates without a timezone are treated as UTC, so
+    they sort alongside dates with a timezone.
+
+    With a limit, only the first items in sort order are kept, selected with a heap rather than a full sort, such as
+    for a feed of the latest 20 posts.
+    """
+
+    # Supported sort orders
+    ORDERS = ['asc', 'desc']
+
+    def __init__(
+        self,
+        key: str,
+        order: str = 'asc',
+        limit: int = None
+    ):
+        """
+        Construct the feed sorter.
+        :param key: "date" to sort by the date of each markdown file, otherwise a front-matter key such as "title"
+        :param order: "asc" or "desc"
+        :param limit: maximum number of items to keep, or None to keep every item
+        """
+        if order not in FeedSorter.ORDERS:
+            raise ValueError(f'Unknown sort order "{order}", must be one of "{FeedSorter.ORDERS}".')
+
+        self.key = key
+        self.order = order
+        self.limit = limit
+
+    def get_sort_key(
+        self,
+        markdown_file: MarkdownFile
+    ) -> tuple:
+        """
+        Get the sort key of a markdown file. Only the file path and front-matter of the file are used.
+        :param markdown_file:
+        :return:
+        """
+        value = markdown_file.date if self.key == 'date' else markdown_file.front_matter.get(self.key)
+
+        # Missing values are placed last, in both orders, and are never compared with other values
+        if value is None:
+            return self.order == 'asc', 0, 0
+
+        return (self.order == 'desc',) + FeedSorter.tag_value(value)
+
+    @staticmethod
+    def tag_value(
+        value: any
+    ) -> tuple:
+        """
+        Tag a value with the rank of its type, so values of different types are never compared with each other.
+        Dates are converted to datetimes in UTC.
+        :param value:
+        :return:
+        """
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return 0, value
+
+        if isinstance(value, datetime.date):
+            if not isinstance(value, datetime.datetime):
+                value = datetime.datetime(value.year, value.month, value.day)
+
+            if value.tzinfo is None or value.utcoffset() is None:
+                return 1, value.replace(tzinfo=datetime.timezone.utc)
+
+            return 1, value.astimezone(datetime.timezone.utc)
+
+        if isinstance(value, str):
+            return 2, value
+
+        return 3, str(value)
+
+    def sort(
+        self,
+        items: list,
+        sort_keys: list
+    ) -> list:
+        """
+        Sort a list of items by their precomputed sort keys, keeping only the first items if there is a limit.
+        :param items:
+        :param sort_keys: the sort key of each item, see get_sort_key()
+        :return:
+        """
+        pairs = list(zip(sort_keys, items))
+        reverse = self.order == 'desc'
+
+        if self.limit is not None and self.limit < len(pairs):
+            pairs = (heapq.nlargest if reverse else heapq.nsmallest)(self.limit, pairs, key=itemgetter(0))
+        else:
+            pairs.sort(key=itemgetter(0), reverse=reverse)
+
+        return [item for _, item in pairs]
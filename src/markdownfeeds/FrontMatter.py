@@ -0,0 +1,81 @@
+import re
+
+import yaml
+
+
+class FrontMatter:
+    """
+    Splits and parses the YAML front-matter of markdown files. The front-matter must start on a "---" delimiter line,
+    which may only be preceded by blank lines, and ends at the next "---" (or "...") delimiter line. Delimiters must be
+    on their own line, so "---" within a front-matter value or the body does not end the front-matter early.
+
+    The libyaml based loader is used when PyYAML has been built with libyaml, it is much faster than the pure Python
+    loader.
+    """
+
+    # Fastest available safe loader
+    LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+    # Front-matter of a whole file, the closing delimiter may be the last line
+    PATTERN = re.compile(
+        r'\A\ufeff?(?:[ \t]*\r?\n)*---[ \t]*\r?\n(.*?)^(?:---|\.\.\.)[ \t]*(?:\r?\n|\Z)', re.DOTALL | re.MULTILINE)
+
+    # Front-matter at the start of a partially read file, the closing delimiter line must be complete
+    PARTIAL_PATTERN = re.compile(
+        r'\A\ufeff?(?:[ \t]*\r?\n)*---[ \t]*\r?\n(.*?)^(?:---|\.\.\.)[ \t]*\r?\n', re.DOTALL | re.MULTILINE)
+
+    @staticmethod
+    def split(
+        content: str,
+        partial: bool = False
+    ) -> tuple | None:
+        """
+        Split the contents of a markdown file into its raw front-matter and body. Returns None if the contents do not
+        start with front-matter.
+        :param content:
+        :param partial: whether the content is only the start of a file
+        :return:
+        """
+        match = (FrontMatter.PARTIAL_PATTERN if partial else FrontMatter.PATTERN).match(content)
+
+        if not match:
+            return None
+
+        return match[1], content[match.end():]
+
+    @staticmethod
+    def parse(
+        front_matter: str
+    ) -> any:
+        """
+        Parse raw YAML front-matter.
+        :param front_matter:
+        :return:
+        """
+        return yaml.load(front_matter, Loader=FrontMatter.LOADER)
+
+    @staticmethod
+    def read_header(
+        file_path: str,
+        encoding: str = 'utf-8',
+        block_size: int = 4096
+    ) -> str | None:
+        """
+        Read only the raw front-matter of a markdown file. The file is read in blocks until the closing delimiter line
+        is found, so the body is not read. Returns None if the file does not start with front-matter.
+        :param file_path:
+        :param encoding:
+        :param block_size:
+        :return:
+        """
+        header = ''
+
+        with open(file_path, encoding=encoding) as file:
+            while True:
+                block = file.read(block_size)
+                header += block
+
+                split = FrontMatter.split(header, partial=bool(block))
+
+                if split or not block:
+                    return split[0] if split else None
@@ -1,4 +1,12 @@
-from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import logging
+import os
+
+from markdownfeeds.ParsedSource import ParsedSource
+from markdownfeeds.Scheduler import Scheduler
+from markdownfeeds.StagedPublisher import StagedPublisher
+
+logging = logging.getLogger(__name__)
 
 
 class Gatherer:
@@ -8,23 +16,158 @@ class Gatherer:
 
     def __init__(
         self,
-        generators: list = None
+        generators: list = None,
+        share_sources: bool = True,
+        max_workers: int = None
     ):
         """
-        Provide a list of feed generators.
+        Provide a list of feed generators. If share_sources is enabled, generators reading the same source directory
+        share a single discovery and parse of its markdown files. All generators share one scheduler, running at most
+        max_workers work items at once, defaulting to the number of CPUs.
         """
         if generators is None:
             generators = []
 
         self.generators = generators
+        self.share_sources = share_sources
+        self.max_workers = max_workers
 
     def generate(
         self
     ):
         """
-        Generate all the feeds in parallel.
+        Generate all the feeds in parallel, on a single event loop and worker pool.
+        """
+        with Scheduler(self.max_workers) as scheduler:
+            return scheduler.run(self.generate_scheduled(scheduler))
+
+    async def generate_scheduled(
+        self,
+        scheduler: Scheduler
+    ) -> list:
+        """
+        Generate all the feeds concurrently, submitting their work to a shared scheduler.
         """
-        with ThreadPoolExecutor() as ex:
-            futures = [ex.submit(generator.run_standalone) for generator in self.generators]
+        for generator in self.generators:
+            generator.scheduler = scheduler
+
+        staged_publishers = []
+
+        try:
+            staged_publishers = self.create_staged_publishers()
+
+            if self.share_sources:
+                await self.parse_shared_sources()
+
+            run_results = list(await asyncio.gather(*[generator.run() for generator in self.generators]))
+
+            [staged_publisher.publish() for staged_publisher in staged_publishers]
+
+            return run_results
+        finally:
+            [staged_publisher.discard() for staged_publisher in staged_publishers]
+
+            for generator in self.generators:
+                generator._shutdown_process_executor()
+                generator.parsed_source = None
+                generator.staged_publisher = None
+                generator.scheduler = None
+
+    def create_staged_publishers(
+        self
+    ) -> [StagedPublisher]:
+        """
+        Create one staged publisher for each target directory that generators stage their pages for, and share it with
+        every generator writing to that target. The target is then published once, after all of them have succeeded,
+        so no generator's build replaces the pages of another.
+        """
+        groups = {}
+
+        for generator in self.generators:
+            if generator.generator_settings.get('staged_publish'):
+                target_directory = os.path.realpath(generator.generator_settings.get('target_directory'))
+                groups.setdefault(target_directory, []).append(generator)
+
+        staged_publishers = []
+
+        for generators in groups.values():
+            staged_publisher = StagedPublisher(generators[0].generator_settings.get('target_directory'))
+            staged_publisher.stage()
+            staged_publishers.append(staged_publisher)
+
+            for generator in generators:
+                generator.staged_publisher = staged_publisher
+
+        return staged_publishers
+
+    async def parse_shared_sources(
+        self
+    ):
+        """
+        Discover and parse each source directory once, then share the parsed markdown files with every generator that
+        reads it. Streaming generators are left to load their own files, to keep their memory use bounded, as are
+        generators that override _process_file_path_to_markdown_file, which must be called for each of their files.
+        """
+        groups = {}
+
+        for generator in self.generators:
+            if generator.generator_settings.get('streaming') or generator._overrides_file_path_processing():
+                continue
+
+            groups.setdefault(Gatherer.get_source_key(generator), []).append(generator)
+
+        for generators in groups.values():
+            if len(generators) < 2:
+                continue
+
+            # The first generator discovers and parses the source, using its own build cache and executor
+            parser = generators[0]
+            file_paths = parser._discover_markdown_file_paths()
+
+            # Only parse the files that at least one of the generators will use
+            used_file_paths = list(dict.fromkeys(
+                file_path
+                for generator in generators
+                for file_path in generator._process_file_path_list(list(file_paths))))
+
+            markdown_files = await parser._read_markdown_files(used_file_paths)
+            parser._save_build_cache(used_file_paths)
+
+            parsed_source = ParsedSource(file_paths, dict(zip(used_file_paths, markdown_files)))
+
+            for generator in generators:
+                generator.parsed_source = parsed_source
+
+            settings = parser.generator_settings
+            source = settings.get('source_cache_directory' if settings.get('source_urls') else 'source_directory')
+
+            logging.info(
+                f'Parsed {len(markdown_files)} markdown files from "{source}" once for {len(generators)} generators.')
+
+    @staticmethod
+    def get_source_key(
+        generator
+    ) -> tuple:
+        """
+        Get a key identifying the source of a generator. Generators with the same key discover and parse exactly the
+        same markdown files. Remote sources are identified by their urls and cache directory, as they may have no
+        source directory.
+        """
+        settings = generator.generator_settings
+
+        if settings.get('source_urls'):
+            source = tuple(settings.get('source_urls')), os.path.realpath(settings.get('source_cache_directory'))
+        else:
+            source = os.path.realpath(settings.get('source_directory'))
 
-        [future.result() for future in futures]
+        return (
+            source,
+            tuple(sorted(settings.get('skip_files'))),
+            tuple(settings.get('ignore_patterns')),
+            settings.get('use_gitignore'),
+            type(generator)._transform_file_path_to_markdown_file,
+            settings.get('markdown_renderer'),
+            settings.get('summary_length'),
+            settings.get('summary_truncate'),
+            settings.get('summary_engine'),
+        )
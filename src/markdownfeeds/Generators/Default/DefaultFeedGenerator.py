@@ -1,17 +1,35 @@
 import asyncio
+import copy
+import hashlib
 import json
 import logging
 import os
+import re
+import shutil
+import time
 
+from concurrent.futures.process import ProcessPoolExecutor
 from concurrent.futures.thread import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from math import ceil
-from pathlib import Path
 from typing import Callable
 
+from markdownfeeds.BuildCache import BuildCache
+from markdownfeeds.FeedSorter import FeedSorter
 from markdownfeeds.Generators import GeneratorSettings
 from markdownfeeds.Generators.Default.Models.Feed import Feed
 from markdownfeeds.Generators.Default.Models.FeedItem import FeedItem
+from markdownfeeds.Generators.Default.Models.RunResult import RunResult
+from markdownfeeds.Generators.Default.Models.StageMetrics import StageMetrics
 from markdownfeeds.MarkdownFile import MarkdownFile
+from markdownfeeds.MarkdownFileDiscovery import MarkdownFileDiscovery
+from markdownfeeds.MarkdownRenderer import MarkdownRenderer
+from markdownfeeds.MarkdownSummarizer import MarkdownSummarizer
+from markdownfeeds.OutputManifest import OutputManifest
+from markdownfeeds.PageCompressor import PageCompressor
+from markdownfeeds.RemoteSource import RemoteSource
+from markdownfeeds.StagedPublisher import StagedPublisher
 
 logging = logging.getLogger(__name__)
 
@@ -41,43 +59,153 @@ class DefaultFeedGenerator:
         self.feed = feed
         self.generator_settings = generator_settings
 
+        self.generator_settings.check()
         self._check_settings()
 
+        self.markdown_renderer = MarkdownRenderer.get(self.generator_settings.get('markdown_renderer'))
+        self.markdown_summarizer = MarkdownSummarizer(
+            self.generator_settings.get('summary_length'),
+            self.generator_settings.get('summary_truncate'),
+            self.generator_settings.get('summary_engine'))
+        self.build_cache = self._create_build_cache()
+        self.output_manifest = OutputManifest(self.generator_settings.get('output_manifest_file_path'))
+        self.page_compressor = self._create_page_compressor()
+        self.feed_sorter = self._create_feed_sorter()
+        self.staged_publisher = None
+        self.remote_source = self._create_remote_source()
+        self.run_result = self._create_run_result()
+        self.export_executor = None
+        self.process_executor = None
+        self.parsed_source = None
+        self.scheduler = None
+
     async def run(
         self
-    ) -> None:
-        # Discover markdown file paths
-        markdown_file_paths = DefaultFeedGenerator.discover_markdown_file_paths(
-            self.generator_settings.get('source_directory'), self.generator_settings.get('skip_files'))
+    ) -> RunResult:
+        """
+        Run the generator, returning the metrics of each pipeline stage.
+        """
+        start = time.perf_counter()
+
+        self.run_result = self._create_run_result()
+        self.output_manifest.reset_counters()
+
+        with self._measure('discover') as metrics:
+            # Discover markdown file paths
+            markdown_file_paths = self._discover_markdown_file_paths()
+
+            # Last chance to process any file paths
+            markdown_file_paths = self._process_file_path_list(markdown_file_paths)
+
+            metrics.items += len(markdown_file_paths)
+
+        # Pages are serialized and written in a bounded pool, so exports overlap. A shared scheduler has its own pool
+        if not self.scheduler:
+            self.export_executor = ThreadPoolExecutor(self.generator_settings.get('export_concurrency'))
+
+        # Pages are written to a staging directory, which is only published if the whole build succeeds. A publisher
+        # shared with other generators, such as by a gatherer, is staged and published by whoever shares it
+        owns_staged_publisher = self.generator_settings.get('staged_publish') and not self.staged_publisher
 
-        # Last chance to process any file paths
-        markdown_file_paths = self._process_file_path_list(markdown_file_paths)
+        if owns_staged_publisher:
+            self.staged_publisher = StagedPublisher(self.generator_settings.get('target_directory'))
+            self.staged_publisher.stage()
 
+        try:
+            if self.generator_settings.get('streaming'):
+                await self._run_streaming(markdown_file_paths)
+            else:
+                await self._run_in_memory(markdown_file_paths)
+
+            if owns_staged_publisher:
+                self.staged_publisher.publish()
+        finally:
+            if self.export_executor:
+                self.export_executor.shutdown()
+                self.export_executor = None
+
+            self._shutdown_process_executor()
+
+            if owns_staged_publisher:
+                self.staged_publisher.discard()
+                self.staged_publisher = None
+
+        with self._measure('save'):
+            self._save_build_cache(markdown_file_paths)
+            self.output_manifest.save()
+
+        self.run_result.wall_time = time.perf_counter() - start
+        self.run_result.pages_written = self.output_manifest.written
+        self.run_result.pages_skipped = self.output_manifest.skipped
+
+        logging.info(
+            f'Wrote {self.output_manifest.written} feed pages and skipped {self.output_manifest.skipped} unchanged '
+            f'feed pages.')
+
+        return self.run_result
+
+    async def _run_in_memory(
+        self,
+        markdown_file_paths: list
+    ) -> None:
+        """
+        Build and export the feed with every markdown file, feed item and feed page held in memory.
+        """
         # Convert a list of file paths into a list of markdown files, async chunked work
-        markdown_files = DefaultFeedGenerator.parallel_work(
-            markdown_file_paths, self._process_file_path_to_markdown_file)
+        with self._measure('load') as metrics:
+            markdown_files = await self._load_markdown_files(markdown_file_paths)
+            metrics.items += len(markdown_files)
 
         # Convert a list of markdown files into a list of feed items, async chunked work
-        feed_items = DefaultFeedGenerator.parallel_work(
-            markdown_files, self.process_markdown_file_to_feed_item)
+        with self._measure('transform') as metrics:
+            feed_items = await self._parallel_work(
+                markdown_files, self.process_markdown_file_to_feed_item)
+            metrics.items += len(feed_items)
 
         # Check feed items
-        self._check_feed_items(feed_items)
+        with self._measure('check') as metrics:
+            self._check_feed_items(feed_items)
+            metrics.items += len(feed_items)
+
+        # Index the feed items for sub-feeds, before the feed is sorted and limited, then sort the feed items
+        with self._measure('sort') as metrics:
+            indexed_feed_items = self._index_feed_items(feed_items)
+            feed_items = self._sort_feed_items(feed_items)
+            metrics.items += len(feed_items)
+
+        # Convert feed items into feed pages, along with the pages of each sub-feed
+        with self._measure('paginate') as metrics:
+            exportable_feeds = self._paginate_feed_items(feed_items)
+            exportable_feeds += self._paginate_sub_feeds(indexed_feed_items)
+            metrics.items += len(exportable_feeds)
 
-        # Sort the feed items
-        feed_items = self._sort_feed_items(feed_items)
+        # Export the completed feed, then remove sub-feeds that are no longer produced
+        with self._measure('export') as metrics:
+            await DefaultFeedGenerator.async_work(exportable_feeds, self._export_feed)
+            self._remove_stale_sub_feeds(indexed_feed_items)
+            metrics.items += len(exportable_feeds)
 
+    def _paginate_feed_items(
+        self,
+        feed_items: [FeedItem],
+        feed_path: str = None
+    ) -> [Feed]:
+        """
+        Split a list of feed items into checked feed pages. The pages of a sub-feed are given the path of the sub-feed,
+        relative to the target directory.
+        """
         # Page tracking
         current_page = 1
         feed_items_per_export = self.generator_settings.get('feed_items_per_export')
         total_pages = ceil(len(feed_items) / feed_items_per_export) if feed_items_per_export else 1
 
-        # Convert feed items into a feed and export the feed
+        # Convert feed items into a feed
         exportable_feeds = []
         for chunked_feed_items in DefaultFeedGenerator.chunk(feed_items, feed_items_per_export):
             # Convert feed items into a feed
             feed = self._feed_items_to_feed(
                 chunked_feed_items, current_page, total_pages, len(feed_items))
+            feed.path = feed_path
 
             # Check the feed is valid
             feed.check()
@@ -89,17 +217,335 @@ class DefaultFeedGenerator:
 
             current_page += 1
 
-        # Export the completed feed
-        await DefaultFeedGenerator.async_work(exportable_feeds, self._export_feed)
+        return exportable_feeds
+
+    def _index_feed_items(
+        self,
+        feed_items: [FeedItem]
+    ) -> dict:
+        """
+        Build an inverted index of feed items over the configured sub-feed keys, mapping each key and slug of a
+        front-matter value to the feed items with that value. Lists of values, such as tags, add a feed item to the
+        entry of each value. Feed items are shared between the feed and its sub-feeds, rather than copied.
+
+        Values without a slug are skipped with a warning. Different values sharing a slug, such as "C#" and "C", are
+        merged into one sub-feed, also with a warning.
+        """
+        index = {}
+        slug_values = {}
+
+        for feed_item in feed_items:
+            file_path = feed_item.markdown_file.file_path
+
+            for key in self.generator_settings.get('sub_feed_keys'):
+                values = feed_item.markdown_file.front_matter.get(key)
+                values = values if isinstance(values, (list, tuple, set)) else [values]
+                slugs = {}
+
+                for value in values:
+                    if value is None:
+                        continue
+
+                    slug = DefaultFeedGenerator.slugify(value)
+                    raw_value = str(value).strip().lower()
+
+                    if not slug:
+                        logging.warning(f'Skipping the "{key}" value "{value}" of "{file_path}", it has no slug.')
+                        continue
+
+                    raw_values = slug_values.setdefault((key, slug), [])
+
+                    if raw_values and raw_value not in raw_values:
+                        logging.warning(
+                            f'The "{key}" values "{raw_values[0]}" and "{value}" of "{file_path}" share the slug '
+                            f'"{slug}", their feed items are merged into one sub-feed.')
+
+                    if raw_value not in raw_values:
+                        raw_values.append(raw_value)
+
+                    slugs[slug] = True
+
+                [index.setdefault((key, slug), []).append(feed_item) for slug in slugs]
+
+        return index
+
+    def _paginate_sub_feeds(
+        self,
+        indexed_feed_items: dict
+    ) -> [Feed]:
+        """
+        Split the feed items of each sub-feed into checked feed pages. Each sub-feed is sorted like the feed itself.
+        """
+        exportable_feeds = []
+
+        for (key, slug), feed_items in indexed_feed_items.items():
+            exportable_feeds += self._paginate_feed_items(
+                self._sort_feed_items(feed_items), self._get_sub_feed_path(key, slug))
+
+        if indexed_feed_items:
+            logging.info(f'Successfully created {len(indexed_feed_items)} sub-feeds.')
+
+        return exportable_feeds
+
+    def _get_sub_feed_path(
+        self,
+        key: str,
+        slug: str
+    ) -> str:
+        """
+        Get the path of a sub-feed, relative to the target directory. Override this to change the sub-feed layout.
+        """
+        return os.path.join(key, slug)
+
+    def _remove_stale_sub_feeds(
+        self,
+        indexed_feed_items: dict
+    ) -> None:
+        """
+        Remove the directories of sub-feeds that are no longer produced, such as the sub-feed of a tag that is no longer
+        used by any file. Only directories within the directory of a sub-feed key are removed. When staging, they are
+        removed from the staging directory, which starts as a copy of the published build.
+        """
+        target_directory = self.generator_settings.get('target_directory')
+
+        if not target_directory:
+            return
+
+        # Sub-feed paths, and the directories leading to them, relative to the target directory
+        sub_feed_paths = set()
+
+        for key, slug in indexed_feed_items:
+            sub_feed_path = os.path.normpath(self._get_sub_feed_path(key, slug))
+
+            while sub_feed_path and sub_feed_path not in sub_feed_paths:
+                sub_feed_paths.add(sub_feed_path)
+                sub_feed_path = os.path.dirname(sub_feed_path)
+
+        for key in self.generator_settings.get('sub_feed_keys'):
+            key_directory = os.path.join(target_directory, key)
+
+            if self.staged_publisher:
+                key_directory = self.staged_publisher.get_staged_file_path(key_directory)
+
+            if not os.path.isdir(key_directory):
+                continue
+
+            for entry in os.scandir(key_directory):
+                if entry.is_dir(follow_symlinks=False) and os.path.join(key, entry.name) not in sub_feed_paths:
+                    shutil.rmtree(entry.path)
+                    logging.info(f'Removed the stale sub-feed "{os.path.join(key, entry.name)}".')
+
+    async def _run_streaming(
+        self,
+        markdown_file_paths: list
+    ) -> None:
+        """
+        Build and export the feed one page at a time, in two phases. First, only the front-matter of each file is
+        scanned to order the file paths, keeping just the sort keys in memory. Then each page is loaded, converted,
+        exported and released before the next one, so peak memory is bounded by the page size rather than the size of
+        the archive. Pages whose inputs are unchanged since they were last exported are skipped without loading any
+        file bodies. Sorting is done with _markdown_file_sort_key rather than _sort_feed_items.
+        """
+        overrides_sort_feed_items = type(self)._sort_feed_items is not DefaultFeedGenerator._sort_feed_items
+
+        if overrides_sort_feed_items and not self._overrides_markdown_file_sort_key():
+            logging.warning(
+                f'{type(self).__name__} overrides _sort_feed_items, which is not used when streaming. Override '
+                f'_markdown_file_sort_key to sort the feed when streaming.')
+
+        # Sort the file paths using a front-matter only scan
+        with self._measure('sort') as metrics:
+            markdown_file_paths = await self._sort_file_paths(markdown_file_paths)
+            metrics.items += len(markdown_file_paths)
+
+        # Page tracking
+        total_items = len(markdown_file_paths)
+        feed_items_per_export = self.generator_settings.get('feed_items_per_export')
+        total_pages = ceil(total_items / feed_items_per_export) if feed_items_per_export else 1
+
+        chunked_file_paths = DefaultFeedGenerator.chunk(markdown_file_paths, feed_items_per_export)
+
+        # Pages are exported in the background while the next page is built, limited to the export concurrency
+        export_slots = asyncio.Semaphore(self.generator_settings.get('export_concurrency'))
+        exports = []
+
+        for current_page, page_file_paths in enumerate(chunked_file_paths, start=1):
+            # Skip pages that were built from exactly the same inputs
+            page_file_path = self._get_feed_page_file_path(current_page)
+            page_signature = self._get_page_signature(page_file_paths, current_page, total_pages, total_items)
+
+            if self.output_manifest.has_page(page_file_path, page_signature):
+                logging.info(f'Skipped building unchanged feed page {current_page}.')
+                self.output_manifest.skip_page()
+                continue
+
+            # Convert the file paths for this page into feed items
+            with self._measure('load') as metrics:
+                markdown_files = await self._load_markdown_files(page_file_paths)
+                metrics.items += len(markdown_files)
+
+            with self._measure('transform') as metrics:
+                feed_items = await self._parallel_work(markdown_files, self.process_markdown_file_to_feed_item)
+                metrics.items += len(feed_items)
+
+            with self._measure('check') as metrics:
+                self._check_feed_items(feed_items)
+                metrics.items += len(feed_items)
+
+            with self._measure('paginate') as metrics:
+                feed = self._feed_items_to_feed(feed_items, current_page, total_pages, total_items)
+                feed.check()
+                metrics.items += 1
+
+            logging.info(f'Successfully created feed page {current_page} with {len(feed.items)} items.')
+
+            with self._measure('export') as metrics:
+                await export_slots.acquire()
+                exports.append(asyncio.create_task(
+                    self._export_streamed_feed(feed, page_file_path, page_signature, export_slots)))
+
+                # Let the export start before building the next page
+                await asyncio.sleep(0)
+
+                metrics.items += 1
+
+        with self._measure('export'):
+            await asyncio.gather(*exports)
+
+    async def _export_streamed_feed(
+        self,
+        feed: Feed,
+        page_file_path: str | None,
+        page_signature: str,
+        export_slots: asyncio.Semaphore
+    ) -> None:
+        """
+        Export a streamed feed page and record its signature, then release its export slot.
+        """
+        try:
+            await self._export_feed(feed)
+            self.output_manifest.set_page(page_file_path, page_signature)
+        finally:
+            export_slots.release()
+
+    async def _sort_file_paths(
+        self,
+        file_paths: list
+    ) -> list:
+        """
+        Sort a list of file paths using the sort key of each markdown file. Only the sort keys are kept in memory. If
+        no sort keys are provided, the original order is kept. With a feed sorter, its order and limit are applied, so
+        only the file paths that are kept are ever loaded. Without a feed sorter or an overridden
+        _markdown_file_sort_key, there are no sort keys, so the front-matter is not scanned at all.
+        """
+        if not self.feed_sorter and not self._overrides_markdown_file_sort_key():
+            return file_paths
+
+        sort_keys = await self._parallel_work(file_paths, self._get_file_path_sort_key)
+
+        if self.feed_sorter:
+            return self.feed_sorter.sort(file_paths, sort_keys)
+
+        if all(sort_key is None for sort_key in sort_keys):
+            return file_paths
+
+        return [file_path for _, file_path in sorted(zip(sort_keys, file_paths), key=lambda pair: pair[0])]
+
+    def _overrides_markdown_file_sort_key(
+        self
+    ) -> bool:
+        """
+        Check if _markdown_file_sort_key is overridden, in which case file paths are sorted by its keys when streaming.
+        """
+        return type(self)._markdown_file_sort_key is not DefaultFeedGenerator._markdown_file_sort_key
+
+    def _get_file_path_sort_key(
+        self,
+        file_path: str
+    ) -> any:
+        """
+        Get the sort key for the markdown file at a file path.
+        """
+        return self._markdown_file_sort_key(self._scan_file_path_to_markdown_file(file_path))
+
+    def _scan_file_path_to_markdown_file(
+        self,
+        file_path: str
+    ) -> MarkdownFile:
+        """
+        Transform a file path to a markdown file containing only the front-matter, the body is not loaded.
+        """
+        return MarkdownFile.load_front_matter(file_path)
+
+    def _get_page_signature(
+        self,
+        file_paths: list,
+        page: int,
+        total_pages: int,
+        total_items: int
+    ) -> str:
+        """
+        Get a signature describing the inputs of a feed page, the page position, the feed and settings of this
+        generator and the path, modification time and size of each file on the page. Settings that are not JSON
+        serializable, such as callbacks, are only described by their type so the signature is stable between runs.
+        """
+        signature = hashlib.sha1()
+        signature.update(json.dumps(
+            [type(self).__name__, page, total_pages, total_items, self.feed.dump() if self.feed else None,
+             self.generator_settings.settings], default=lambda value: type(value).__qualname__,
+            sort_keys=True).encode('utf-8'))
+
+        for file_path in file_paths:
+            stat = os.stat(file_path)
+            signature.update(f'{os.path.abspath(file_path)}:{stat.st_mtime_ns}:{stat.st_size}'.encode('utf-8'))
+
+        return signature.hexdigest()
+
+    def _markdown_file_sort_key(
+        self,
+        markdown_file: MarkdownFile
+    ) -> any:
+        """
+        Get the key to sort a markdown file by when streaming, smallest first unless the configured sort order is
+        descending. Return None to keep the discovered order. By default, this is the key of the configured sort key.
+        Override this to provide custom sorting in streaming mode. Only the file path and front-matter of the markdown
+        file are available, the body is not loaded.
+        """
+        if not self.feed_sorter:
+            return None
+
+        return self.feed_sorter.get_sort_key(markdown_file)
+
+    def __getstate__(
+        self
+    ) -> dict:
+        """
+        Drop the build cache and output manifest when pickling, they are only used by the parent process and are not
+        needed by process pool workers. Instrumentation callbacks are dropped from the settings for the same reason,
+        they are often lambdas or local functions, which can not be pickled.
+        """
+        state = self.__dict__.copy()
+        state['generator_settings'] = copy.copy(self.generator_settings)
+        state['generator_settings'].settings = {**self.generator_settings.settings, 'instrumentation_callbacks': []}
+        state['build_cache'] = None
+        state['output_manifest'] = None
+        state['run_result'] = None
+        state['export_executor'] = None
+        state['process_executor'] = None
+        state['parsed_source'] = None
+        state['scheduler'] = None
+        state['staged_publisher'] = None
+        state['remote_source'] = None
+        return state
 
     def run_standalone(
         self
-    ):
+    ) -> RunResult:
         """
         Run this in synchronous mode.
         """
         logging.info(f'Running feed generator in standalone mode.')
-        asyncio.run(self.run())
+        return asyncio.run(self.run())
 
     def _check_settings(
         self
@@ -109,6 +555,109 @@ class DefaultFeedGenerator:
         """
         pass
 
+    def _create_build_cache(
+        self
+    ) -> BuildCache | None:
+        """
+        Create the build cache, if one has been configured.
+        """
+        if not self.generator_settings.get('cache_file_path'):
+            return None
+
+        return BuildCache(self.generator_settings.get('cache_file_path'))
+
+    def _create_page_compressor(
+        self
+    ) -> PageCompressor | None:
+        """
+        Create the page compressor, if precompressed pages have been configured.
+        """
+        if not self.generator_settings.get('precompress'):
+            return None
+
+        return PageCompressor(self.generator_settings.get('precompress'))
+
+    def _create_feed_sorter(
+        self
+    ) -> FeedSorter | None:
+        """
+        Create the feed sorter, if a sort key has been configured.
+        """
+        if not self.generator_settings.get('sort_by'):
+            return None
+
+        return FeedSorter(
+            self.generator_settings.get('sort_by'),
+            self.generator_settings.get('sort_order'),
+            self.generator_settings.get('sort_limit'))
+
+    def _create_remote_source(
+        self
+    ) -> RemoteSource | None:
+        """
+        Create the remote source, if source urls have been configured.
+        """
+        if not self.generator_settings.get('source_urls'):
+            return None
+
+        return RemoteSource(
+            self.generator_settings.get('source_urls'),
+            self.generator_settings.get('source_cache_directory'),
+            self.generator_settings.get('source_url_concurrency'),
+            self.generator_settings.get('source_request_timeout'),
+            self.generator_settings.get('source_request_headers'))
+
+    def _discover_markdown_file_paths(
+        self
+    ) -> [str]:
+        """
+        Discover the markdown file paths in the source directory, or reuse them from the shared parsed source. With a
+        remote source, the remote files are synced to the cache directory and their local paths are used, in the order
+        of the source urls.
+        """
+        if self.parsed_source:
+            return list(self.parsed_source.file_paths)
+
+        if self.remote_source:
+            return self.remote_source.sync()
+
+        return DefaultFeedGenerator.discover_markdown_file_paths(
+            self.generator_settings.get('source_directory'),
+            self.generator_settings.get('skip_files'),
+            self.generator_settings.get('ignore_patterns'),
+            self.generator_settings.get('use_gitignore'))
+
+    def _create_run_result(
+        self
+    ) -> RunResult:
+        """
+        Create a new run result, to record the metrics of a run.
+        """
+        return RunResult(type(self).__name__, self.generator_settings.get('target_directory'))
+
+    @contextmanager
+    def _measure(
+        self,
+        stage: str
+    ):
+        """
+        Measure a pipeline stage, recording its wall time and build cache hits. The stage metrics are yielded so item
+        counts can be added, then passed to any configured instrumentation callbacks.
+        """
+        metrics = self.run_result.get_stage(stage)
+        cache_hits, cache_misses = (self.build_cache.hits, self.build_cache.misses) if self.build_cache else (0, 0)
+        start = time.perf_counter()
+
+        yield metrics
+
+        metrics.wall_time += time.perf_counter() - start
+
+        if self.build_cache:
+            metrics.cache_hits += self.build_cache.hits - cache_hits
+            metrics.cache_misses += self.build_cache.misses - cache_misses
+
+        [callback(self.run_result, metrics) for callback in self.generator_settings.get('instrumentation_callbacks')]
+
     def _check_feed_item(
         self,
         feed_item: FeedItem
@@ -116,7 +665,7 @@ class DefaultFeedGenerator:
         """
         Check if a feed item is valid or not.
         """
-        logging.info(f'Checking feed item {feed_item}...')
+        logging.debug(f'Checking feed item {feed_item}...')
         feed_item.check()
         
     def _check_feed_items(
@@ -133,9 +682,15 @@ class DefaultFeedGenerator:
         feed_items: [FeedItem]
     ) -> [FeedItem]:
         """
-        Sort a list of feed items. Override this to provided custom sorting.
+        Sort a list of feed items, using the configured sort key, order and limit. If no sort key is configured, the
+        original order is kept. Override this to provided custom sorting.
         """
-        return feed_items
+        if not self.feed_sorter:
+            return feed_items
+
+        sort_keys = [self.feed_sorter.get_sort_key(feed_item.markdown_file) for feed_item in feed_items]
+
+        return self.feed_sorter.sort(feed_items, sort_keys)
 
     def _process_markdown_file(
         self,
@@ -167,7 +722,7 @@ class DefaultFeedGenerator:
         """
         feed_item = self._transform_markdown_file_to_feed_item(markdown_file)
 
-        logging.info(f'Successfully converted markdown file "{markdown_file}" to feed item.')
+        logging.debug(f'Successfully converted markdown file "{markdown_file}" to feed item.')
 
         return feed_item
 
@@ -185,9 +740,9 @@ class DefaultFeedGenerator:
         file_path: str
     ) -> MarkdownFile:
         """
-        Transform a file path to a markdown file.
+        Transform a file path to a markdown file, using the configured markdown renderer and summarizer.
         """
-        return MarkdownFile.load(file_path)
+        return MarkdownFile.load(file_path, renderer=self.markdown_renderer, summarizer=self.markdown_summarizer)
 
     def _process_file_path_to_markdown_file(
         self,
@@ -199,12 +754,114 @@ class DefaultFeedGenerator:
         """
         markdown_file = self._transform_file_path_to_markdown_file(file_path)
 
-        logging.info(f'Successfully converted file path "{file_path}" to markdown file.')
+        logging.debug(f'Successfully converted file path "{file_path}" to markdown file.')
 
         markdown_file = self._process_markdown_file(markdown_file)
 
-        logging.info(f'Successfully processed markdown file "{markdown_file}".')
+        logging.debug(f'Successfully processed markdown file "{markdown_file}".')
+
+        return markdown_file
+
+    async def _load_markdown_files(
+        self,
+        file_paths: list
+    ) -> [MarkdownFile]:
+        """
+        Convert a list of file paths into a list of processed markdown files. If a build cache or a shared parsed
+        source is available, only files that are not found in them are read and parsed. If
+        _process_file_path_to_markdown_file is overridden, it is called for every file instead, as cached and shared
+        markdown files have not been through it.
+        """
+        if (not self.build_cache and not self.parsed_source) or self._overrides_file_path_processing():
+            self._record_bytes_read(file_paths)
+            return await self._parallel_work(file_paths, self._process_file_path_to_markdown_file)
+
+        return await self._parallel_work(await self._read_markdown_files(file_paths), self._process_markdown_file)
+
+    def _overrides_file_path_processing(
+        self
+    ) -> bool:
+        """
+        Check if _process_file_path_to_markdown_file is overridden, in which case files can not be taken from the build
+        cache or a shared parsed source.
+        """
+        process_fn = type(self)._process_file_path_to_markdown_file
+        return process_fn is not DefaultFeedGenerator._process_file_path_to_markdown_file
+
+    async def _read_markdown_files(
+        self,
+        file_paths: list
+    ) -> [MarkdownFile]:
+        """
+        Read a list of file paths into markdown files, without processing them. Files are taken from the shared parsed
+        source first, then from the build cache for files that have not changed since the last build. Only the
+        remaining files are read and parsed, and are then stored in the build cache.
+        """
+        markdown_files = {}
+
+        for file_path in file_paths:
+            markdown_file = self.parsed_source.get(file_path) if self.parsed_source else None
+
+            if markdown_file is None and self.build_cache:
+                markdown_file = self.build_cache.load(file_path, self.markdown_renderer, self.markdown_summarizer)
+
+            markdown_files[file_path] = markdown_file
+
+        changed_file_paths = [file_path for file_path in file_paths if markdown_files[file_path] is None]
+
+        if self.build_cache:
+            logging.info(
+                f'Build cache has {len(file_paths) - len(changed_file_paths)} unchanged and '
+                f'{len(changed_file_paths)} changed markdown files.')
+
+        self._record_bytes_read(changed_file_paths)
+
+        changed_markdown_files = await self._parallel_work(
+            changed_file_paths, self._transform_file_path_to_cacheable_markdown_file)
+
+        for file_path, markdown_file in zip(changed_file_paths, changed_markdown_files):
+            if self.build_cache:
+                self.build_cache.store(file_path, markdown_file)
+
+            markdown_files[file_path] = markdown_file
+
+        return [markdown_files[file_path] for file_path in file_paths]
+
+    def _record_bytes_read(
+        self,
+        file_paths: list
+    ) -> None:
+        """
+        Record the number of bytes read when loading some files in the load stage metrics.
+        """
+        self.run_result.get_stage('load').bytes_read += sum(
+            os.path.getsize(file_path) for file_path in file_paths if os.path.isfile(file_path))
+
+    def _save_build_cache(
+        self,
+        file_paths: list
+    ) -> None:
+        """
+        Save the build cache, if one is configured, removing entries for files that no longer exist. When using a
+        shared parsed source, the cache is saved by whoever parsed the source instead.
+        """
+        if not self.build_cache or self.parsed_source:
+            return
+
+        self.build_cache.prune(file_paths)
+        self.build_cache.save()
 
+    def _transform_file_path_to_cacheable_markdown_file(
+        self,
+        file_path: str
+    ) -> MarkdownFile:
+        """
+        Transform a file path to a markdown file and compute its derived values, ready to be stored in the build cache.
+        The html is only rendered up front when it is kept in a persistent build cache, so later builds do not need to
+        render it, otherwise it is rendered if and when it is used.
+        """
+        markdown_file = self._transform_file_path_to_markdown_file(file_path)
+        markdown_file.precompute(bool(self.build_cache and self.build_cache.cache_file_path))
         return markdown_file
 
     def _feed_items_to_feed(
@@ -233,6 +890,17 @@ class DefaultFeedGenerator:
         """
         return Feed()
 
+    def _get_feed_page_file_path(
+        self,
+        page: int,
+        feed_path: str = None
+    ) -> str | None:
+        """
+        Get the file path a feed page is exported to, or None if pages are not exported to files. Pages of a sub-feed
+        are exported within the path of the sub-feed.
+        """
+        return None
+
     async def _export_feed(
         self,
         feed: Feed
@@ -242,22 +910,174 @@ class DefaultFeedGenerator:
         """
         print(json.dumps(feed.dump(), indent=2))
 
+    async def _write_feed_page(
+        self,
+        file_path: str,
+        render_page: Callable[[], str]
+    ) -> bool:
+        """
+        Render an exported feed page and write it to disk. Rendering and writing run in the bounded export pool, or the
+        shared scheduler's pool, so several pages can be exported at once. Pages whose content has not changed since
+        the last build are not rewritten. If precompression is enabled, compressed siblings of the page are written in
+        the same worker, unless the page is unchanged and its siblings are up-to-date. Returns True if the page was
+        written.
+        """
+        # When staging, the manifest still tracks the published path, but the page is written to the staging directory
+        write_file_path = self.staged_publisher.get_staged_file_path(file_path) if self.staged_publisher else file_path
+
+        def write_feed_page() -> int:
+            content = render_page()
+            content = content if isinstance(content, bytes) else content.encode('utf-8')
+            written = self.output_manifest.write(file_path, content, write_file_path=write_file_path)
+
+            if self.page_compressor and (written or not self.page_compressor.is_compressed(write_file_path)):
+                written += self.page_compressor.compress(write_file_path, content)
+
+            return written
+
+        if self.scheduler:
+            bytes_written = await asyncio.wrap_future(self.scheduler.submit(self, write_feed_page))
+        else:
+            bytes_written = await asyncio.get_running_loop().run_in_executor(self.export_executor, write_feed_page)
+
+        self.run_result.get_stage('export').bytes_written += bytes_written
+
+        if bytes_written:
+            logging.info(f'Successfully wrote feed page to "{file_path}".')
+        else:
+            logging.info(f'Skipped writing unchanged feed page "{file_path}".')
+
+        return bool(bytes_written)
+
+    async def _parallel_work(
+        self,
+        work_items: list,
+        process_list_fn: Callable
+    ) -> list:
+        """
+        Run parallel work using the executor strategy configured in the generator settings. When the generator is
+        run by a shared scheduler, thread work is queued in the scheduler's pool instead of a pool of its own, and
+        process and serial work is run as a single task in the scheduler's pool, so other generators on the same event
+        loop keep running while this work completes.
+        """
+        if self.scheduler and self.generator_settings.get('executor') == 'thread':
+            results = await self.scheduler.map(self, process_list_fn, work_items)
+            logging.info(f'Successfully completed scheduled work on {len(work_items)} work items.')
+            return results
+
+        run_work = partial(
+            DefaultFeedGenerator.parallel_work,
+            work_items,
+            process_list_fn,
+            self.generator_settings.get('executor'),
+            self.generator_settings.get('executor_max_workers'),
+            self.generator_settings.get('executor_chunk_size'),
+            self._get_process_executor())
+
+        if self.scheduler:
+            return await asyncio.wrap_future(self.scheduler.submit(self, run_work))
+
+        return run_work()
+
+    def _get_process_executor(
+        self
+    ) -> ProcessPoolExecutor | None:
+        """
+        Get the process pool of the current run, creating it on first use, or None if the executor is not "process".
+        The pool is reused by every stage, and every page when streaming, until the run completes.
+        """
+        if self.generator_settings.get('executor') != 'process':
+            return None
+
+        if not self.process_executor:
+            self.process_executor = ProcessPoolExecutor(self.generator_settings.get('executor_max_workers'))
+
+        return self.process_executor
+
+    def _shutdown_process_executor(
+        self
+    ) -> None:
+        """
+        Shut down the process pool of the current run, if one was created.
+        """
+        if self.process_executor:
+            self.process_executor.shutdown()
+            self.process_executor = None
+
     @staticmethod
     def parallel_work(
         work_items: list,
-        process_list_fn: Callable
+        process_list_fn: Callable,
+        executor: str = 'thread',
+        max_workers: int = None,
+        chunk_size: int = None,
+        process_executor: ProcessPoolExecutor = None
     ) -> list:
         """
         This function takes a list of work items, chunks them into lists of a specified size and then
         calls a process callback function over each of those chunks. This function allows you to run chunks of work
         in parallel. The function will then await completion of all the work chunks and return the processed list.
+
+        The executor can be "thread" (a thread pool, one task per work item), "process" (a process pool, work items
+        are sent in chunked batches to reduce pickling overhead) or "serial" (no pool at all). When using "process",
+        the process_list_fn and work items must be picklable. A process pool can be provided to reuse it between calls,
+        it is then left running, otherwise a pool is created and shut down for this call.
         """
-        with ThreadPoolExecutor() as ex:
-            futures = [ex.submit(process_list_fn, work_item) for work_item in work_items]
+        if executor == 'serial':
+            results = [process_list_fn(work_item) for work_item in work_items]
+
+        elif executor == 'process':
+            if not chunk_size:
+                chunk_size = DefaultFeedGenerator.get_chunk_size(len(work_items), max_workers)
+
+            if process_executor:
+                chunked_results = process_executor.map(
+                    partial(DefaultFeedGenerator.process_work_chunk, process_list_fn),
+                    DefaultFeedGenerator.chunk(work_items, chunk_size))
+
+                results = [result for chunk_result in chunked_results for result in chunk_result]
+            else:
+                with ProcessPoolExecutor(max_workers) as ex:
+                    chunked_results = ex.map(
+                        partial(DefaultFeedGenerator.process_work_chunk, process_list_fn),
+                        DefaultFeedGenerator.chunk(work_items, chunk_size))
+
+                    results = [result for chunk_result in chunked_results for result in chunk_result]
+
+        elif executor == 'thread':
+            with ThreadPoolExecutor(max_workers) as ex:
+                futures = [ex.submit(process_list_fn, work_item) for work_item in work_items]
+
+            results = [future.result() for future in futures]
+
+        else:
+            raise ValueError(f'Unknown executor "{executor}".')
 
         logging.info(f'Successfully completed parallel work on {len(work_items)} work items.')
 
-        return [future.result() for future in futures]
+        return results
+
+    @staticmethod
+    def process_work_chunk(
+        process_list_fn: Callable,
+        work_chunk: list
+    ) -> list:
+        """
+        Process a chunk of work items, used by process pool workers.
+        """
+        return [process_list_fn(work_item) for work_item in work_chunk]
+
+    @staticmethod
+    def get_chunk_size(
+        total_work_items: int,
+        max_workers: int = None
+    ) -> int:
+        """
+        Get a chunk size that gives each worker a few chunks, so work is evenly spread without sending every work item
+        to a worker individually.
+        """
+        workers = max_workers if max_workers else (os.cpu_count() or 1)
+        return max(1, ceil(total_work_items / (workers * 4)))
 
     @staticmethod
     async def async_work(
@@ -277,21 +1097,25 @@ class DefaultFeedGenerator:
     @staticmethod
     def discover_markdown_file_paths(
         directory_path: str,
-        skip_files: list = None
+        skip_files: list = None,
+        ignore_patterns: list = None,
+        use_gitignore: bool = False
     ) -> [str]:
         """
-        Discover all markdown files within a provided directory, skipping some files if needed.
+        Discover all markdown files within a provided directory, skipping some files if needed. Directories matching
+        the ignore patterns, or the rules of .gitignore files if use_gitignore is enabled, are not walked.
         """
-        if skip_files is None:
-            skip_files = []
+        return list(MarkdownFileDiscovery(directory_path, skip_files, ignore_patterns, use_gitignore).walk())
 
-        if not os.path.isdir(directory_path):
-            raise Exception(f'The provided path "{directory_path}", must be a directory.')
-
-        return list(
-            filter(
-                lambda x: os.path.basename(x) not in skip_files,
-                [str(path) for path in Path(directory_path).glob('**/*.md')]))
+    @staticmethod
+    def slugify(
+        value: any
+    ) -> str:
+        """
+        Convert a front-matter value into a lowercase slug that is safe to use as a directory name. Letters and digits
+        of any script are kept, so "café" and "日本" keep their own slugs.
+        """
+        return re.sub(r'[^\w.+]+', '-', str(value).lower()).strip('-.')
 
     @staticmethod
     def chunk(
@@ -14,6 +14,7 @@ class Feed:
         self.page = None
         self.total_pages = None
         self.total_items = None
+        self.path = None
 
     def set(
         self,
@@ -55,9 +56,24 @@ class Feed:
     def dump(
         self
     ) -> dict:
+        self._set_page_values()
+
+        return self.store.dump()
+
+    def export(
+        self
+    ) -> dict:
+        """
+        Export the feed for a serializer, without dumping each feed item.
+        """
+        self._set_page_values()
+
+        return self.store.export()
+
+    def _set_page_values(
+        self
+    ):
         self.store.set('items', self.items)
         self.store.set('page', self.page)
         self.store.set('total_pages', self.total_pages)
         self.store.set('total_items', self.total_items)
-
-        return self.store.dump()
@@ -3,6 +3,8 @@ from markdownfeeds.MarkdownFile import MarkdownFile
 
 
 class FeedItem:
+    __slots__ = ('store', 'markdown_file')
+
     def __init__(
         self
     ):
@@ -0,0 +1,49 @@
+from markdownfeeds.Generators.Default.Models.StageMetrics import StageMetrics
+
+
+class RunResult:
+    """
+    The result of a generator run, holding the metrics of each pipeline stage.
+    """
+
+    def __init__(
+        self,
+        generator: str = None,
+        target: str = None
+    ):
+        self.generator = generator
+        self.target = target
+        self.stages: dict[str, StageMetrics] = {}
+        self.wall_time = 0.0
+        self.pages_written = 0
+        self.pages_skipped = 0
+
+    def get_stage(
+        self,
+        name: str
+    ) -> StageMetrics:
+        """
+        Get the metrics of a stage, creating them if the stage has not been recorded yet.
+        """
+        if name not in self.stages:
+            self.stages[name] = StageMetrics(name)
+
+        return self.stages[name]
+
+    def dump(
+        self
+    ) -> dict:
+        return {
+            'generator': self.generator,
+            'target': self.target,
+            'wall_time': self.wall_time,
+            'pages_written': self.pages_written,
+            'pages_skipped': self.pages_skipped,
+            'stages': {name: stage.dump() for name, stage in self.stages.items()},
+        }
+
+    def __str__(
+        self
+    ):
+        return f'{self.generator} ({self.target}): {self.wall_time:.4f}s, ' + ', '.join(
+            str(stage) for stage in self.stages.values())
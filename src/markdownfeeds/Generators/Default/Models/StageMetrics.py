@@ -0,0 +1,35 @@
+class StageMetrics:
+    """
+    Metrics recorded for a single stage of a generator run. If a stage runs several times, such as once per page when
+    streaming, the metrics are accumulated.
+    """
+
+    def __init__(
+        self,
+        name: str
+    ):
+        self.name = name
+        self.wall_time = 0.0
+        self.items = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def dump(
+        self
+    ) -> dict:
+        return {
+            'name': self.name,
+            'wall_time': self.wall_time,
+            'items': self.items,
+            'bytes_read': self.bytes_read,
+            'bytes_written': self.bytes_written,
+            'cache_hits': self.cache_hits,
+            'cache_misses': self.cache_misses,
+        }
+
+    def __str__(
+        self
+    ):
+        return f'{self.name}: {self.wall_time:.4f}s, {self.items} items'
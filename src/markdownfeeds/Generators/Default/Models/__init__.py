@@ -2,6 +2,8 @@ from typing import Self
 
 
 class ItemStore:
+    __slots__ = ('store',)
+
     def __init__(
         self,
         initial_values: dict = None
@@ -94,6 +96,15 @@ class ItemStore:
     ):
         return self.store.keys()
 
+    def export(
+        self
+    ) -> dict:
+        """
+        Export the values that are set, without exporting the values themselves. Used by serializers that export
+        nested values as they reach them, rather than building a full copy like dump.
+        """
+        return {key: value for key, value in self.store.items() if value is not None}
+
     def dump(
         self
     ) -> dict:
@@ -1,11 +1,10 @@
+import hashlib
 import logging
 import os
 
-import chevron
-
-from markdownfeeds import write_to_file, read_from_file
 from markdownfeeds.Generators import GeneratorSettings
 from markdownfeeds.Generators.Default.Models.Feed import Feed
+from markdownfeeds.Generators.Html.HtmlTemplate import HtmlTemplate
 from markdownfeeds.Generators.Json.JsonFeedGenerator import JsonFeedGenerator
 from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
 
@@ -24,7 +23,8 @@ class HtmlFeedGenerator(JsonFeedGenerator):
     ):
 
         JsonFeedGenerator.__init__(self, feed, generator_settings)
-        self.template_file_path = template_file_path
+        self.template_file_path = template_file_path if template_file_path else HtmlFeedGenerator.DEFAULT_TEMPLATE
+        self.template = HtmlTemplate.load(self.template_file_path)
 
     async def _export_feed(
         self,
@@ -36,23 +36,29 @@ class HtmlFeedGenerator(JsonFeedGenerator):
         feed_url = self.get_feed_page_name(feed.page)
         next_feed_url = self.get_feed_page_name(feed.page + 1) if (feed.page + 1) < feed.total_pages else None
         previous_feed_url = self.get_feed_page_name(feed.page - 1) if feed.page > 1 else None
-        feed_file_target = os.path.join(self.generator_settings.get('target_directory'), feed_url)
+        feed_file_target = self._get_feed_page_file_path(feed.page, feed.path)
 
         if self.generator_settings.has('feed_base_url'):
-            feed_base_url = self.generator_settings.get('feed_base_url').rstrip('/')
+            feed_base_url = self._get_feed_base_url(feed.path)
             previous_feed_url = f'{feed_base_url}/{previous_feed_url}'
             next_feed_url = f'{feed_base_url}/{next_feed_url}'
 
-        template = read_from_file(os.path.join(os.path.dirname(os.path.realpath(__file__)), 'template.html'))
-
-        content = chevron.render(
-            template, {
-                **{'nextPageUrl': next_feed_url, 'previousPageUrl': previous_feed_url, 'title': feed.get('title'),
-                    'files': [f.dump() for f in feed.items]}, **feed.dump()})
+        await self._write_feed_page(feed_file_target, lambda: self.template.render({
+            **{'nextPageUrl': next_feed_url, 'previousPageUrl': previous_feed_url, 'title': feed.get('title'),
+               'files': [f.dump() for f in feed.items]}, **feed.dump()}))
 
-        write_to_file(feed_file_target, content)
-
-        logging.info(f'Successfully wrote feed page to "{feed_file_target}".')
+    def _get_page_signature(
+        self,
+        file_paths: list,
+        page: int,
+        total_pages: int,
+        total_items: int
+    ) -> str:
+        """
+        Get a signature describing the inputs of a feed page, including the template it is rendered with.
+        """
+        signature = JsonFeedGenerator._get_page_signature(self, file_paths, page, total_pages, total_items)
+        return hashlib.sha1(f'{signature}:{self.template.checksum}'.encode('utf-8')).hexdigest()
 
     @staticmethod
     def get_feed_page_name(
@@ -0,0 +1,60 @@
+import hashlib
+import os
+import threading
+
+import chevron
+from chevron.tokenizer import tokenize
+
+from markdownfeeds import read_from_file
+
+
+class HtmlTemplate:
+    """
+    A Mustache template that is read and tokenized once, then reused to render every page. Templates are cached by
+    path and modification time, so generators sharing a template also share the tokenized template.
+    """
+
+    # Tokenized templates, keyed by real path and modification time
+    _cache = {}
+    _cache_lock = threading.Lock()
+
+    def __init__(
+        self,
+        template_file_path: str,
+        tokens: list,
+        checksum: str
+    ):
+        self.template_file_path = template_file_path
+        self.tokens = tokens
+        self.checksum = checksum
+
+    def render(
+        self,
+        data: dict
+    ) -> str:
+        """
+        Render the template with some data.
+        """
+        return chevron.render(self.tokens, data)
+
+    @staticmethod
+    def load(
+        template_file_path: str
+    ):
+        """
+        Load a template from a file, reusing the tokenized template if it has already been loaded and not changed since.
+        """
+        real_path = os.path.realpath(template_file_path)
+
+        if not os.path.isfile(real_path):
+            raise FileNotFoundError(f'The template file "{template_file_path}", does not exist.')
+
+        key = (real_path, os.stat(real_path).st_mtime_ns)
+
+        with HtmlTemplate._cache_lock:
+            if key not in HtmlTemplate._cache:
+                template = read_from_file(real_path)
+                HtmlTemplate._cache[key] = HtmlTemplate(
+                    real_path, list(tokenize(template)), hashlib.sha1(template.encode('utf-8')).hexdigest())
+
+            return HtmlTemplate._cache[key]
@@ -1,11 +1,10 @@
-import json
 import logging
 import os
 
-from markdownfeeds import write_to_file
 from markdownfeeds.Generators import GeneratorSettings
 from markdownfeeds.Generators.Default.DefaultFeedGenerator import DefaultFeedGenerator
 from markdownfeeds.Generators.Default.Models.Feed import Feed
+from markdownfeeds.Generators.Json.JsonSerializer import JsonSerializer
 from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
 from markdownfeeds.Generators.Json.Models.JsonFeedItem import JsonFeedItem
 from markdownfeeds.MarkdownFile import MarkdownFile
@@ -16,7 +15,6 @@ logging = logging.getLogger(__name__)
 class JsonFeedGenerator(DefaultFeedGenerator):
     # JSON Feed version
     JSON_FEED_VERSION = f'https://jsonfeed.org/version/1'
-    JSON_INDENTATION = 2
 
     def __init__(
         self,
@@ -30,6 +28,9 @@ class JsonFeedGenerator(DefaultFeedGenerator):
 
         DefaultFeedGenerator.__init__(self, feed, generator_settings)
 
+        self.serializer = JsonSerializer(
+            self.generator_settings.get('json_backend'), self.generator_settings.get('json_compact'))
+
     def _check_settings(
         self
     ):
@@ -75,7 +76,7 @@ class JsonFeedGenerator(DefaultFeedGenerator):
         feed_item.set('summary', markdown_file.summary)
         feed_item = self._inject_feed_item_details(feed_item, markdown_file)
 
-        logging.info(f'Successfully converted markdown file "{markdown_file}" to feed item.')
+        logging.debug(f'Successfully converted markdown file "{markdown_file}" to feed item.')
 
         return feed_item
 
@@ -89,12 +90,11 @@ class JsonFeedGenerator(DefaultFeedGenerator):
         """
         return feed_item_details
 
-    def _dump_feed(self, feed: Feed):
+    def _dump_feed(self, feed: Feed) -> bytes | str:
         """
         Dump a feed.
         """
-        return json.dumps(
-            feed.dump(), indent=JsonFeedGenerator.JSON_INDENTATION)
+        return self.serializer.dump_feed(feed)
 
     async def _export_feed(
         self,
@@ -103,19 +103,51 @@ class JsonFeedGenerator(DefaultFeedGenerator):
         """
         Export a feed.
         """
-        feed_url = 'feed.json' if feed.page == 1 else f'{feed.page - 1}.json'
-        next_feed_url = f'{feed.page}.json' if feed.page < feed.total_pages else None
-        feed_file_target = os.path.join(self.generator_settings.get('target_directory'), feed_url)
+        feed_url = self.get_feed_page_name(feed.page)
+        next_feed_url = self.get_feed_page_name(feed.page + 1) if feed.page < feed.total_pages else None
+        feed_file_target = self._get_feed_page_file_path(feed.page, feed.path)
 
         if self.generator_settings.has('feed_base_url'):
-            feed_url = f'{self.generator_settings.get("feed_base_url").rstrip("/")}/{feed_url}'
+            feed_url = f'{self._get_feed_base_url(feed.path)}/{feed_url}'
 
         if self.generator_settings.has('feed_base_url') and next_feed_url:
-            next_feed_url = f'{self.generator_settings.get("feed_base_url").rstrip("/")}/{next_feed_url}'
+            next_feed_url = f'{self._get_feed_base_url(feed.path)}/{next_feed_url}'
 
         feed.set('feed_url', feed_url)
         feed.set('next_url', next_feed_url)
 
-        write_to_file(feed_file_target, self._dump_feed(feed))
+        await self._write_feed_page(feed_file_target, lambda: self._dump_feed(feed))
+
+    def _get_feed_page_file_path(
+        self,
+        page: int,
+        feed_path: str = None
+    ) -> str:
+        """
+        Get the file path a feed page is exported to.
+        """
+        feed_directory = os.path.join(self.generator_settings.get('target_directory'), feed_path if feed_path else '')
+        return os.path.join(feed_directory, self.get_feed_page_name(page))
+
+    def _get_feed_base_url(
+        self,
+        feed_path: str = None
+    ) -> str:
+        """
+        Get the base url of the pages of a feed, including the path of a sub-feed.
+        """
+        feed_base_url = self.generator_settings.get('feed_base_url').rstrip('/')
+
+        if feed_path:
+            return f'{feed_base_url}/{feed_path.replace(os.sep, "/")}'
+
+        return feed_base_url
+
+    @staticmethod
+    def get_feed_page_name(
+        page_number: int
+    ) -> str:
+        if page_number <= 1:
+            return 'feed.json'
 
-        logging.info(f'Successfully wrote feed page to "{feed_file_target}".')
+        return f'{page_number - 1}.json'
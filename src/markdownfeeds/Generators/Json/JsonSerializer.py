@@ -0,0 +1,117 @@
+import datetime
+import json
+
+from markdownfeeds.Generators.Default.Models import ItemStore
+from markdownfeeds.Generators.Default.Models.Feed import Feed
+from markdownfeeds.Generators.Default.Models.FeedItem import FeedItem
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
+
+
+class JsonSerializer:
+    """
+    Serializes feeds to JSON. Feed items are exported as they are reached by the JSON encoder, straight from their
+    stores, rather than first being copied into nested dicts.
+
+    The fastest available backend is used by default: orjson, then ujson, then the standard library json module. The
+    backends produce the same JSON, except that orjson and ujson write non-ASCII characters as UTF-8 rather than
+    escaping them. Dates and times, such as unquoted front-matter dates, are written in ISO 8601 format by every
+    backend.
+    """
+
+    # Supported backends, "auto" picks the fastest installed backend
+    BACKENDS = ['auto', 'orjson', 'ujson', 'json']
+
+    # Indentation used when not in compact mode
+    INDENTATION = 2
+
+    def __init__(
+        self,
+        backend: str = 'auto',
+        compact: bool = False
+    ):
+        """
+        Construct the serializer.
+        :param backend: one of "auto", "orjson", "ujson" or "json"
+        :param compact: write JSON without indentation or whitespace
+        """
+        if backend not in JsonSerializer.BACKENDS:
+            raise ValueError(f'Unknown JSON backend "{backend}", must be one of "{JsonSerializer.BACKENDS}".')
+
+        if backend == 'auto':
+            backend = 'orjson' if orjson else 'ujson' if ujson else 'json'
+
+        if (backend == 'orjson' and not orjson) or (backend == 'ujson' and not ujson):
+            raise ValueError(f'The JSON backend "{backend}" is not installed.')
+
+        self.backend = backend
+        self.compact = compact
+
+    def dump_feed(
+        self,
+        feed: Feed
+    ) -> bytes | str:
+        """
+        Serialize a feed. Returns bytes when the backend produces them, to avoid decoding and encoding the output again.
+        Feeds that override dump() are serialized from its output instead, so the override is honoured.
+        """
+        if type(feed).dump is not Feed.dump:
+            return self.dumps(feed.dump())
+
+        return self.dumps(feed.export())
+
+    def dumps(
+        self,
+        value: any
+    ) -> bytes | str:
+        """
+        Serialize a value, exporting any feed items or other store backed objects within it.
+        """
+        if self.backend == 'orjson':
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+            return orjson.dumps(
+                value,
+                default=JsonSerializer.export_value,
+                option=options | (0 if self.compact else orjson.OPT_INDENT_2))
+
+        if self.backend == 'ujson':
+            return ujson.dumps(
+                value,
+                default=JsonSerializer.export_value,
+                indent=0 if self.compact else JsonSerializer.INDENTATION,
+                ensure_ascii=False,
+                escape_forward_slashes=False)
+
+        if self.compact:
+            return json.dumps(value, default=JsonSerializer.export_value, separators=(',', ':'))
+
+        return json.dumps(value, default=JsonSerializer.export_value, indent=JsonSerializer.INDENTATION)
+
+    @staticmethod
+    def export_value(
+        value: any
+    ) -> any:
+        """
+        Export a value the JSON encoder does not support itself. Feed items that do not override dump() are exported
+        straight from their stores, the values within them are exported when the encoder reaches them. Dates and times
+        are exported in ISO 8601 format.
+        """
+        if isinstance(value, (datetime.date, datetime.time)):
+            return value.isoformat()
+
+        if isinstance(value, FeedItem) and type(value).dump is FeedItem.dump and isinstance(value.store, ItemStore):
+            return value.store.export()
+
+        if callable(getattr(value, 'dump', None)):
+            return value.dump()
+
+        raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
@@ -7,6 +7,10 @@ class Author(JsonFeedItem):
     """
     A class representing a JSON Feed Author.
     """
+    __slots__ = ()
+
+    # Keys used in the JSON Feed specification
+    PROTECTED_KEYS = ('name', 'url', 'avatar')
 
     def __init__(
         self,
@@ -16,7 +20,7 @@ class Author(JsonFeedItem):
     ):
         super().__init__()
 
-        self.store = JsonFeedItemStore(['name', 'url', 'avatar'])
+        self.store = JsonFeedItemStore(Author.PROTECTED_KEYS)
 
         self.name = name
         self.url = url
@@ -7,6 +7,10 @@ class Hub(JsonFeedItem):
     """
     A class representing a JSON Feed Hub.
     """
+    __slots__ = ()
+
+    # Keys used in the JSON Feed specification
+    PROTECTED_KEYS = ('type', 'url')
 
     def __init__(
         self,
@@ -14,7 +18,7 @@ class Hub(JsonFeedItem):
         url: str = None
     ):
         super().__init__()
-        self.store = JsonFeedItemStore(['type', 'url'])
+        self.store = JsonFeedItemStore(Hub.PROTECTED_KEYS)
 
         self.type = hub_type
         self.url = url
@@ -5,7 +5,19 @@ from markdownfeeds.Generators.Json.Models import JsonFeedItemStore
 class JsonFeedItem(FeedItem):
     """
     A class representing a JSON Feed Item.
+
+    Each protected key (used in the JSON Feed specification) is available as a property that reads and writes the
+    store, so values are only held once. Subclasses get properties for their own PROTECTED_KEYS. Custom keys in the
+    store can be read as attributes, but other attributes are plain attributes that are never exported, use set() to
+    add a custom key to the feed.
     """
+    # Plain attributes are kept in an instance dict, which is only created once one is set
+    __slots__ = ('__dict__',)
+
+    # Keys used in the JSON Feed specification
+    PROTECTED_KEYS = (
+        'id', 'url', 'external_url', 'title', 'content_html', 'content_text', 'summary', 'image', 'banner_image',
+        'date_published', 'date_modified', 'author', 'tags')
 
     def __init__(
         self,
@@ -25,9 +37,7 @@ class JsonFeedItem(FeedItem):
     ):
         super().__init__()
 
-        self.store = JsonFeedItemStore(
-            ['id', 'url', 'external_url', 'title', 'content_html', 'content_text', 'summary', 'image', 'banner_image',
-             'date_published', 'date_modified', 'author', 'tags'])
+        self.store = JsonFeedItemStore(JsonFeedItem.PROTECTED_KEYS)
 
         # Mostly for convenience, we could also just use the store, but this makes it easier for JsonFeedItem references
         # to know exactly what can be customized.
@@ -45,26 +55,6 @@ class JsonFeedItem(FeedItem):
         self.author = author
         self.tags = tags
 
-    def set(
-        self,
-        key: str,
-        data: any
-    ) -> any:
-        super().__setattr__(key, data)
-        return self.store.set(key, data)
-
-    def replace(
-        self,
-        original_key: str,
-        updated_key: str
-    ):
-        original_value = self.get(original_key)
-
-        if hasattr(self, original_key):
-            delattr(self, original_key)
-
-        super().replace(original_key, updated_key)
-
     def is_protected(
         self,
         key: str
@@ -74,16 +64,40 @@ class JsonFeedItem(FeedItem):
         """
         return self.store.is_protected(key)
 
-    def __setattr__(
+    def __getattr__(
         self,
-        key,
-        value
+        key
     ):
         """
-        This method is to make it convenient to use this class. It attempts to sync the store with
-        the class attributes.
+        Only called for attributes that are not found otherwise, this makes custom keys readable as attributes.
         """
-        if hasattr(self, 'store') and hasattr(self.store, 'protected_keys') and key in self.store.protected_keys:
-            self.set(key, value)
+        if key.startswith('__') or key in FeedItem.__slots__:
+            raise AttributeError(key)
+
+        if not self.has(key):
+            raise AttributeError(f'"{type(self).__name__}" has no attribute or value "{key}".')
+
+        return self.get(key)
+
+    def __init_subclass__(
+        cls,
+        **kwargs
+    ):
+        super().__init_subclass__(**kwargs)
+        cls.add_store_properties()
+
+    @classmethod
+    def add_store_properties(
+        cls
+    ):
+        """
+        Add a property for each protected key, that reads and writes the value in the store.
+        """
+        for key in cls.PROTECTED_KEYS:
+            if not hasattr(cls, key):
+                setattr(cls, key, property(
+                    lambda self, key=key: self.get(key) if self.has(key) else None,
+                    lambda self, value, key=key: self.set(key, value)))
+
 
-        return super().__setattr__(key, value)
+JsonFeedItem.add_store_properties()
@@ -2,44 +2,56 @@ from markdownfeeds.Generators.Default.Models import ItemStore
 
 
 class JsonFeedItemStore(ItemStore):
+    """
+    An item store for JSON Feed objects. Protected keys (used in the JSON Feed specification) are stored as is, any
+    other key is stored with a "_" prefix, as JSON Feed requires for custom extensions.
+    """
+    __slots__ = ('protected_keys', 'protected_key_set', 'key_names')
+
+    # Stored name of each key, per list of protected keys. Shared by every store with the same protected keys, so each
+    # key name is only worked out once
+    KEY_NAMES = {}
+
     def __init__(
         self,
         protected_keys: list = None
     ):
-        ItemStore.__init__(self)
+        self.protected_keys = tuple(protected_keys) if protected_keys else ()
+
+        if self.protected_keys not in JsonFeedItemStore.KEY_NAMES:
+            JsonFeedItemStore.KEY_NAMES[self.protected_keys] = (
+                frozenset(self.protected_keys), {key: key for key in self.protected_keys})
 
-        self.protected_keys = protected_keys if protected_keys else []
+        self.protected_key_set, self.key_names = JsonFeedItemStore.KEY_NAMES[self.protected_keys]
 
-        [self.set(pk, None) for pk in self.protected_keys]
+        ItemStore.__init__(self, dict.fromkeys(self.protected_keys))
 
     def get(
         self,
         key: str
     ) -> any:
-        return super().get(self.get_key_name(key))
+        key_name = self.get_key_name(key)
+
+        if key_name not in self.store:
+            return super().get(key_name)
+
+        return self.store[key_name]
 
     def clear(self, key=None):
-        super().clear(self.get_key_name(key))
+        super().clear(self.get_key_name(key) if key else None)
 
     def has(
         self,
         key: str
     ) -> any:
-        return super().has(self.get_key_name(key))
+        return self.get_key_name(key) in self.store
 
     def set(
         self,
         key: str,
         data: any
     ) -> any:
-        key = self.get_key_name(key)
-
-        if key in self.protected_keys:
-            super().__setattr__(key, data)
-            super().set(key, data)
-            return
-
-        super().set(key, data)
+        self.store[self.get_key_name(key)] = data
 
     def is_protected(
         self,
@@ -48,7 +60,7 @@ class JsonFeedItemStore(ItemStore):
         """
         Check if a key is in the protected key list.
         """
-        return key in self.protected_keys
+        return key in self.protected_key_set
 
     def get_key_name(
         self,
@@ -57,10 +69,16 @@ class JsonFeedItemStore(ItemStore):
         """
         Get a protected key name.
         """
-        if key.startswith('_'):
-            key = key.lstrip('_')
+        try:
+            return self.key_names[key]
+        except KeyError:
+            pass
+
+        key_name = key.lstrip('_')
+
+        if key_name not in self.protected_key_set:
+            key_name = f'_{key_name}'
 
-        if key in self.protected_keys:
-            return key
+        self.key_names[key] = key_name
 
-        return f'_{key}'
+        return key_name
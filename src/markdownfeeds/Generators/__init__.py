@@ -3,12 +3,42 @@ import os
 
 
 class GeneratorSettings:
+    # Supported strategies for running the parsing and rendering stages
+    EXECUTORS = ['thread', 'process', 'serial']
+
     def __init__(
         self,
         feed_items_per_export: int = 100,
         source_directory: str = None,
         target_directory: str = None,
         skip_files: list = None,
+        cache_file_path: str = None,
+        output_manifest_file_path: str = None,
+        executor: str = 'thread',
+        executor_max_workers: int = None,
+        executor_chunk_size: int = None,
+        streaming: bool = False,
+        instrumentation_callbacks: list = None,
+        export_concurrency: int = 8,
+        ignore_patterns: list = None,
+        use_gitignore: bool = False,
+        json_backend: str = 'auto',
+        json_compact: bool = False,
+        precompress: list = None,
+        staged_publish: bool = False,
+        source_urls: list = None,
+        source_cache_directory: str = None,
+        source_url_concurrency: int = 8,
+        source_request_headers: dict = None,
+        source_request_timeout: float = 30,
+        markdown_renderer: str = 'markdown',
+        summary_length: int = 100,
+        summary_truncate: str = 'character',
+        summary_engine: str = 'markdown',
+        sort_by: str = None,
+        sort_order: str = 'asc',
+        sort_limit: int = None,
+        sub_feed_keys: list = None,
         **kwargs
     ):
         self.settings = {}
@@ -18,6 +48,33 @@ class GeneratorSettings:
         self.set('source_directory', source_directory.rstrip(os.sep) if source_directory else None)
         self.set('target_directory', target_directory.rstrip(os.sep) if target_directory else None)
         self.set('skip_files', skip_files if skip_files else [])
+        self.set('cache_file_path', cache_file_path)
+        self.set('output_manifest_file_path', output_manifest_file_path)
+        self.set('executor', executor)
+        self.set('executor_max_workers', executor_max_workers)
+        self.set('executor_chunk_size', executor_chunk_size)
+        self.set('streaming', streaming)
+        self.set('instrumentation_callbacks', instrumentation_callbacks if instrumentation_callbacks else [])
+        self.set('export_concurrency', export_concurrency)
+        self.set('ignore_patterns', ignore_patterns if ignore_patterns else [])
+        self.set('use_gitignore', use_gitignore)
+        self.set('json_backend', json_backend)
+        self.set('json_compact', json_compact)
+        self.set('precompress', precompress if precompress else [])
+        self.set('staged_publish', staged_publish)
+        self.set('source_urls', source_urls if source_urls else [])
+        self.set('source_cache_directory', source_cache_directory)
+        self.set('source_url_concurrency', source_url_concurrency)
+        self.set('source_request_headers', source_request_headers if source_request_headers else {})
+        self.set('source_request_timeout', source_request_timeout)
+        self.set('markdown_renderer', markdown_renderer)
+        self.set('summary_length', summary_length)
+        self.set('summary_truncate', summary_truncate)
+        self.set('summary_engine', summary_engine)
+        self.set('sort_by', sort_by)
+        self.set('sort_order', sort_order)
+        self.set('sort_limit', sort_limit)
+        self.set('sub_feed_keys', sub_feed_keys if sub_feed_keys else [])
 
         # All other settings
         [self.set(key, kwargs[key]) for key in kwargs]
@@ -44,9 +101,20 @@ class GeneratorSettings:
     def check(
         self
     ):
-        pass
+        if self.get('executor') not in GeneratorSettings.EXECUTORS:
+            raise ValueError(
+                f'Unknown executor "{self.get("executor")}", must be one of "{GeneratorSettings.EXECUTORS}".')
+
+        if self.get('source_urls') and not self.get('source_cache_directory'):
+            raise ValueError('A "source_cache_directory" must be provided to download "source_urls" to.')
+
+        if self.get('sort_limit') is not None and not self.get('sort_by'):
+            raise ValueError('A "sort_by" key must be provided to keep the first "sort_limit" items.')
+
+        if self.get('sub_feed_keys') and self.get('streaming'):
+            raise ValueError('Sub-feeds need every feed item in memory, "sub_feed_keys" can not be used when streaming.')
 
     def __str__(
         self
     ):
-        return json.dumps(self.settings)
+        return json.dumps(self.settings, default=str)
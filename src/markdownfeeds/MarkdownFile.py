@@ -1,15 +1,13 @@
+import copy
 import hashlib
 import logging
 import os.path
-import re
 
-import html2text
-import markdown
-import yaml
-from dateutil import parser
-
-from markdownfeeds import read_from_file
+from markdownfeeds.DateResolver import DateResolver
 from markdownfeeds.Exceptions import DateParseError, TitleNotFoundError, InvalidMarkdownFrontMatterError
+from markdownfeeds.FrontMatter import FrontMatter
+from markdownfeeds.MarkdownRenderer import MarkdownRenderer
+from markdownfeeds.MarkdownSummarizer import MarkdownSummarizer
 
 logging = logging.getLogger(__name__)
 
@@ -18,27 +16,120 @@ class MarkdownFile:
     """
     This class represents a single Markdown file. The markdown file should contain front-matter and contents. Please
     see https://jekyllrb.com/docs/collections/#add-content for more information.
+
+    Derived values (id, date, html and summary) are memoized on the instance. They are invalidated when the body,
+    front-matter or file path are replaced, and also recomputed if the front-matter key they are based on has changed.
     """
 
+    # The front-matter key each derived value depends on, or None if it only depends on the body
+    DERIVED_FRONT_MATTER_KEYS = {'id': 'id', 'date': 'date', 'html': None, 'summary': 'summary'}
+
+    # Summarizer used by markdown files that are not given one
+    DEFAULT_SUMMARIZER = MarkdownSummarizer()
+
     def __init__(
         self,
         file_path: str = '',
         front_matter: dict = None,
-        body: str = ''
+        body: str = '',
+        derived: dict = None,
+        renderer: MarkdownRenderer = None,
+        summarizer: MarkdownSummarizer = None
     ):
         """
         Construct the markdown file.
         :param file_path:
         :param front_matter:
         :param body:
+        :param derived: previously computed derived values (id, date, html and summary), such as from a build cache
+        :param renderer: renderer used to convert the body to html, the shared default renderer if not provided
+        :param summarizer: summarizer used to generate the summary, the default summarizer if not provided
         """
         if not front_matter:
             front_matter = {}
 
+        self._memo = {}
+        self.renderer = renderer
+        self.summarizer = summarizer
         self.file_path = file_path
         self.front_matter = front_matter
         self.body = body.strip('\n')
 
+        # The stat details and content hash of the file this was loaded from, see load()
+        self.source = None
+
+        if derived:
+            [self._memoize(name, lambda: derived[name]) for name in derived]
+
+    @property
+    def file_path(
+        self
+    ) -> str:
+        """
+        Return the path of the markdown file.
+        :return:
+        """
+        return self._file_path
+
+    @file_path.setter
+    def file_path(
+        self,
+        file_path: str
+    ):
+        """
+        Set the path of the markdown file, invalidating values derived from it.
+        :param file_path:
+        :return:
+        """
+        self._file_path = file_path
+        self._invalidate('id', 'date')
+
+    @property
+    def front_matter(
+        self
+    ) -> dict:
+        """
+        Return the front-matter of the markdown file.
+        :return:
+        """
+        return self._front_matter
+
+    @front_matter.setter
+    def front_matter(
+        self,
+        front_matter: dict
+    ):
+        """
+        Set the front-matter of the markdown file, invalidating values derived from it.
+        :param front_matter:
+        :return:
+        """
+        self._front_matter = front_matter
+        self._invalidate('id', 'date', 'summary')
+
+    @property
+    def body(
+        self
+    ) -> str:
+        """
+        Return the body of the markdown file.
+        :return:
+        """
+        return self._body
+
+    @body.setter
+    def body(
+        self,
+        body: str
+    ):
+        """
+        Set the body of the markdown file, invalidating values derived from it.
+        :param body:
+        :return:
+        """
+        self._body = body
+        self._invalidate('html', 'summary')
+
     @property
     def file_name(
         self
@@ -76,6 +167,15 @@ class MarkdownFile:
         Generate a unique id using the file path.
         :return:
         """
+        return self._memoize('id', self._compute_id)
+
+    def _compute_id(
+        self
+    ):
+        """
+        Compute the id of the file.
+        :return:
+        """
         if 'id' in self.front_matter:
             return self.front_matter['id']
 
@@ -101,26 +201,23 @@ class MarkdownFile:
         """
         Attempts to find the date of a file. First priority is a date value in the front-matter. If nothing is found,
         will attempt to extract from the file name. Can possibly return None if no value is found. If a date is found,
-        will parse it raising a DateParseError error if/on failure.
+        will parse it raising a DateParseError error if/on failure. Dates that YAML has already parsed are used as
+        they are.
         :return:
         """
-        date = None
+        return self._memoize('date', self._compute_date)
 
+    def _compute_date(
+        self
+    ):
+        """
+        Compute the date of the file.
+        :return:
+        """
         if 'date' in self.front_matter:
-            date = self.front_matter['date']
-        else:
-            date_match = re.search(r'(\d+-\d+-\d+)', self.file_name)
-
-            if date_match:
-                date = date_match[0]
+            return DateResolver.resolve(self.front_matter['date'])
 
-        if date:
-            try:
-                return parser.parse(date)
-            except ValueError or OverflowError:
-                raise DateParseError('Unable to parse the date from the front-matter, incorrect format.')
-
-        return date
+        return DateResolver.resolve(file_name=self.file_name)
 
     @property
     def html(
@@ -130,63 +227,237 @@ class MarkdownFile:
         Convert the markdown contents to html.
         :return:
         """
-        return MarkdownFile.markdown_to_html(self.body)
+        return self._memoize('html', lambda: MarkdownFile.markdown_to_html(self.body, self.renderer))
 
     @property
     def summary(
-        self,
-        max_length: int = 100
+        self
     ) -> str:
         """
         Generate a summary of the file. If summary is in front-matter, will use that. If not, it will attempt to
-        generate one from the content of the file.
+        generate one from the content of the file. The length and truncation of the summary are set by the summarizer.
+        :return:
+        """
+        return self._memoize('summary', self._compute_summary)
+
+    def _compute_summary(
+        self
+    ) -> str:
+        """
+        Compute the summary of the file.
+        :return:
+        """
+        summarizer = self.summarizer if self.summarizer else MarkdownFile.DEFAULT_SUMMARIZER
+
+        if 'summary' in self.front_matter:
+            return summarizer.shorten(self.front_matter['summary'])
+
+        return summarizer.summarize(self.body, lambda: self.html)
+
+    def copy(
+        self
+    ):
+        """
+        Create a copy of this markdown file, with its own deep copy of the front-matter, so nested lists and dicts such
+        as tags are not shared either. Memoized derived values are kept.
+        :return:
+        """
+        markdown_file = MarkdownFile(
+            self.file_path, copy.deepcopy(self.front_matter), self.body, renderer=self.renderer,
+            summarizer=self.summarizer)
+        markdown_file._memo = dict(self._memo)
+
+        return markdown_file
+
+    def precompute(
+        self,
+        include_html: bool = False
+    ) -> dict:
+        """
+        Compute the derived values of this file (id, date and summary) and return them. The html is only rendered if
+        requested, otherwise it is only included if it has already been rendered, as not every feed needs it. A date
+        that cannot be parsed is left out, so the error is raised when the date is actually used.
+        :param include_html:
+        :return:
+        """
+        derived = {'id': self.id, 'summary': self.summary}
+
+        if include_html or 'html' in self._memo:
+            derived['html'] = self.html
+
+        try:
+            derived['date'] = self.date
+        except (DateParseError, TypeError, OverflowError):
+            pass
+
+        return derived
+
+    def _memoize(
+        self,
+        name: str,
+        compute
+    ) -> any:
+        """
+        Return a memoized derived value, computing it if it has not been computed yet or if the front-matter value it
+        depends on has changed since.
+        :param name:
+        :param compute:
         :return:
         """
-        summary = self.front_matter['summary'] if 'summary' in self.front_matter else html2text.html2text(self.html)
+        dependency = self._get_derived_dependency(name)
+        memo = self._memo.get(name)
 
-        summary = summary.replace('\n', ' ')
+        if memo is not None and memo[0] == dependency:
+            return memo[1]
 
-        if len(summary) > max_length:
-            return summary[0:max_length].strip() + '..'
+        value = compute()
+        self._memo[name] = (dependency, value)
 
-        return summary.strip('\n').strip()
+        return value
+
+    def _get_derived_dependency(
+        self,
+        name: str
+    ) -> tuple | None:
+        """
+        Get the current state of the front-matter value a derived value depends on.
+        :param name:
+        :return:
+        """
+        key = MarkdownFile.DERIVED_FRONT_MATTER_KEYS[name]
+
+        if key is None:
+            return None
+
+        return key in self.front_matter, self.front_matter.get(key)
+
+    def _invalidate(
+        self,
+        *names: str
+    ):
+        """
+        Invalidate some memoized derived values.
+        :param names:
+        :return:
+        """
+        [self._memo.pop(name, None) for name in names]
 
     @staticmethod
     def load(
         markdown_file_path: str,
-        encoding: str = 'utf-8'
+        encoding: str = 'utf-8',
+        renderer: MarkdownRenderer = None,
+        summarizer: MarkdownSummarizer = None
     ):
         """
-        Load a markdown file from a file on disk.
+        Load a markdown file from a file on disk. The stat details of the file, taken before it is read, and the hash of
+        the bytes that were parsed are kept as the source of the markdown file, so a file that is saved while it is
+        being loaded is never mistaken for the version that was parsed.
         :param markdown_file_path:
         :param encoding:
+        :param renderer:
+        :param summarizer:
         :return:
         """
-        logging.info(f'Loading Markdown file at path "{markdown_file_path}".')
+        logging.debug(f'Loading Markdown file at path "{markdown_file_path}".')
 
         if not os.path.exists(markdown_file_path):
             raise FileNotFoundError(f'The markdown file "{markdown_file_path}", does not exist.')
 
-        file_segments = read_from_file(markdown_file_path, encoding).split('---', 2)
+        stat = os.stat(markdown_file_path)
+
+        with open(markdown_file_path, 'rb') as file:
+            content = file.read()
 
-        if len(file_segments) != 3:
+        # Line endings are translated like a file read in text mode
+        front_matter, body = MarkdownFile.split_front_matter(
+            markdown_file_path, content.decode(encoding).replace('\r\n', '\n').replace('\r', '\n'))
+
+        markdown_file = MarkdownFile(markdown_file_path, front_matter, body, renderer=renderer, summarizer=summarizer)
+        markdown_file.source = (stat.st_mtime_ns, stat.st_size), MarkdownFile.hash_content(content)
+
+        return markdown_file
+
+    @staticmethod
+    def hash_content(
+        content: bytes
+    ) -> str:
+        """
+        Hash the raw contents of a markdown file.
+        :param content:
+        :return:
+        """
+        return hashlib.sha1(content).hexdigest()
+
+    @staticmethod
+    def load_front_matter(
+        markdown_file_path: str,
+        encoding: str = 'utf-8',
+        block_size: int = 4096
+    ):
+        """
+        Load only the front-matter of a markdown file from disk. The file is read in blocks until the end of the
+        front-matter is found, so the body is never read. The returned markdown file has an empty body.
+        :param markdown_file_path:
+        :param encoding:
+        :param block_size:
+        :return:
+        """
+        if not os.path.exists(markdown_file_path):
+            raise FileNotFoundError(f'The markdown file "{markdown_file_path}", does not exist.')
+
+        header = FrontMatter.read_header(markdown_file_path, encoding, block_size)
+
+        if header is None:
+            raise InvalidMarkdownFrontMatterError(f'Markdown file "{markdown_file_path}" is in an incorrect format.')
+
+        return MarkdownFile(markdown_file_path, MarkdownFile.parse_front_matter(markdown_file_path, header))
+
+    @staticmethod
+    def split_front_matter(
+        markdown_file_path: str,
+        content: str
+    ) -> (dict, str):
+        """
+        Split the contents of a markdown file into its parsed front-matter and its body.
+        :param markdown_file_path:
+        :param content:
+        :return:
+        """
+        split = FrontMatter.split(content)
+
+        if split is None:
             raise InvalidMarkdownFrontMatterError(f'Markdown file "{markdown_file_path}" is in an incorrect format.')
 
-        front_matter = yaml.safe_load(file_segments[1])
+        return MarkdownFile.parse_front_matter(markdown_file_path, split[0]), split[1]
+
+    @staticmethod
+    def parse_front_matter(
+        markdown_file_path: str,
+        front_matter: str
+    ) -> dict:
+        """
+        Parse the raw front-matter of a markdown file, which must be a YAML mapping.
+        :param markdown_file_path:
+        :param front_matter:
+        :return:
+        """
+        front_matter = FrontMatter.parse(front_matter)
 
         if type(front_matter) is not dict:
             raise InvalidMarkdownFrontMatterError(f'Markdown file "{markdown_file_path}" has invalid front-matter.')
 
-        return MarkdownFile(markdown_file_path, front_matter, file_segments[2])
+        return front_matter
 
     @staticmethod
     def markdown_to_html(
-        markdown_content: str
+        markdown_content: str,
+        renderer: MarkdownRenderer = None
     ) -> str:
         """
-        Convert Markdown to HTML.
+        Convert Markdown to HTML, with the shared default renderer if no renderer is provided.
         """
-        return markdown.markdown(markdown_content, extensions=['fenced_code', 'tables'])
+        return (renderer if renderer else MarkdownRenderer.get()).render(markdown_content)
 
     def __str__(
         self
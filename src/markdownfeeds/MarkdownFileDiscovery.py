@@ -0,0 +1,234 @@
+import os
+import re
+from pathlib import Path
+from typing import Iterator
+
+from markdownfeeds import read_from_file
+
+
+class MarkdownFileDiscovery:
+    """
+    Discovers markdown files within a directory, using os.scandir. Files are found in the same order as
+    Path.glob('**/*.md'), each directory's files first, then each of its subdirectories in turn.
+
+    Files and directories matching an ignore pattern are pruned before they are visited, so excluded directories are
+    never walked. Ignore patterns use .gitignore syntax, and .gitignore files found in the tree can be applied too.
+    """
+
+    # Name of the ignore files that are read when use_gitignore is enabled
+    IGNORE_FILE_NAME = '.gitignore'
+
+    def __init__(
+        self,
+        directory_path: str,
+        skip_files: list = None,
+        ignore_patterns: list = None,
+        use_gitignore: bool = False,
+        extension: str = '.md'
+    ):
+        """
+        Construct the discovery engine.
+        :param directory_path:
+        :param skip_files: names of files to skip
+        :param ignore_patterns: .gitignore style patterns, relative to the directory
+        :param use_gitignore: apply the rules of .gitignore files found within the directory
+        :param extension:
+        """
+        if not os.path.isdir(directory_path):
+            raise Exception(f'The provided path "{directory_path}", must be a directory.')
+
+        # Normalized like pathlib, so the discovered paths match those of Path.glob
+        self.directory_path = str(Path(directory_path))
+        self.skip_files = frozenset(skip_files if skip_files else [])
+        self.use_gitignore = use_gitignore
+        self.extension = extension
+        self.ignore_rules = MarkdownFileDiscovery.compile_rules(ignore_patterns if ignore_patterns else [])
+
+        if use_gitignore:
+            self.ignore_rules.append(MarkdownFileDiscovery.compile_rule('.git/'))
+
+    def walk(
+        self
+    ) -> Iterator[str]:
+        """
+        Lazily yield the path of each markdown file, so callers can start work before the walk has finished.
+        :return:
+        """
+        path_prefix = '' if self.directory_path == '.' else os.path.join(self.directory_path, '')
+
+        yield from self._walk_directory(path_prefix, '', self.ignore_rules)
+
+    def _walk_directory(
+        self,
+        path_prefix: str,
+        relative_path: str,
+        ignore_rules: list
+    ) -> Iterator[str]:
+        """
+        Yield the markdown files in a directory, then those of each subdirectory that is not ignored.
+        :param path_prefix: prefix of every discovered path
+        :param relative_path: path of the directory relative to the root, ending with a separator unless it is the root
+        :param ignore_rules:
+        :return:
+        """
+        directory_path = path_prefix + relative_path
+
+        if self.use_gitignore:
+            ignore_rules = ignore_rules + MarkdownFileDiscovery.read_ignore_file(
+                os.path.join(directory_path, MarkdownFileDiscovery.IGNORE_FILE_NAME), relative_path)
+
+        subdirectories = []
+
+        try:
+            entries = os.scandir(directory_path if directory_path else '.')
+        except OSError:
+            return
+
+        with entries:
+            for entry in entries:
+                try:
+                    is_directory = entry.is_dir()
+                except OSError:
+                    continue
+
+                entry_relative_path = relative_path + entry.name
+
+                if ignore_rules and MarkdownFileDiscovery.is_ignored(ignore_rules, entry_relative_path, is_directory):
+                    continue
+
+                if is_directory:
+                    # Symbolic links to directories are not followed, like Path.glob
+                    if not entry.is_symlink():
+                        subdirectories.append(entry_relative_path + '/')
+
+                elif entry.name.endswith(self.extension) and entry.name not in self.skip_files:
+                    yield path_prefix + entry_relative_path
+
+        for subdirectory in subdirectories:
+            yield from self._walk_directory(path_prefix, subdirectory, ignore_rules)
+
+    @staticmethod
+    def is_ignored(
+        ignore_rules: list,
+        relative_path: str,
+        is_directory: bool
+    ) -> bool:
+        """
+        Check if a path is ignored. The last matching rule wins, so negated rules can re-include a path.
+        :param ignore_rules:
+        :param relative_path:
+        :param is_directory:
+        :return:
+        """
+        ignored = False
+
+        for pattern, negated, directory_only in ignore_rules:
+            if directory_only and not is_directory:
+                continue
+
+            if pattern.match(relative_path):
+                ignored = not negated
+
+        return ignored
+
+    @staticmethod
+    def read_ignore_file(
+        file_path: str,
+        relative_path: str
+    ) -> list:
+        """
+        Read the rules of an ignore file, if it exists.
+        :param file_path:
+        :param relative_path: path of the directory holding the ignore file, relative to the root
+        :return:
+        """
+        if not os.path.isfile(file_path):
+            return []
+
+        return MarkdownFileDiscovery.compile_rules(read_from_file(file_path).splitlines(), relative_path)
+
+    @staticmethod
+    def compile_rules(
+        patterns: list,
+        relative_path: str = ''
+    ) -> list:
+        """
+        Compile a list of .gitignore style patterns, skipping blank lines and comments.
+        :param patterns:
+        :param relative_path: path the patterns are relative to
+        :return:
+        """
+        rules = [MarkdownFileDiscovery.compile_rule(pattern, relative_path) for pattern in patterns]
+        return [rule for rule in rules if rule]
+
+    @staticmethod
+    def compile_rule(
+        pattern: str,
+        relative_path: str = ''
+    ) -> tuple | None:
+        """
+        Compile a .gitignore style pattern into a tuple of the regular expression matching the paths it applies to,
+        whether it is negated and whether it only applies to directories.
+        :param pattern:
+        :param relative_path: path the pattern is relative to
+        :return:
+        """
+        pattern = pattern.strip()
+
+        if not pattern or pattern.startswith('#'):
+            return None
+
+        negated = pattern.startswith('!')
+        pattern = pattern[1:] if negated else pattern
+
+        directory_only = pattern.endswith('/')
+        pattern = pattern.rstrip('/')
+
+        # Patterns containing a separator are relative to their directory, others match a name at any depth
+        anchored = '/' in pattern
+        expression = MarkdownFileDiscovery.translate(pattern.lstrip('/'))
+
+        if not anchored:
+            expression = '(?:.*/)?' + expression
+
+        return re.compile(re.escape(relative_path) + expression + '$'), negated, directory_only
+
+    @staticmethod
+    def translate(
+        pattern: str
+    ) -> str:
+        """
+        Translate a .gitignore style glob into a regular expression. Wildcards do not match a separator, except "**".
+        :param pattern:
+        :return:
+        """
+        expression = ''
+        index = 0
+
+        while index < len(pattern):
+            if pattern.startswith('**/', index):
+                expression += '(?:.*/)?'
+                index += 3
+            elif pattern.startswith('**', index):
+                expression += '.*'
+                index += 2
+            elif pattern[index] == '*':
+                expression += '[^/]*'
+                index += 1
+            elif pattern[index] == '?':
+                expression += '[^/]'
+                index += 1
+            elif pattern[index] == '[' and ']' in pattern[index + 2:]:
+                end = pattern.index(']', index + 2)
+                characters = pattern[index + 1:end]
+                characters = '^' + characters[1:] if characters.startswith('!') else characters
+                expression += '[' + characters.replace('\\', '\\\\') + ']'
+                index = end + 1
+            elif pattern[index] == '\\' and index + 1 < len(pattern):
+                expression += re.escape(pattern[index + 1])
+                index += 2
+            else:
+                expression += re.escape(pattern[index])
+                index += 1
+
+        return expression
@@ -0,0 +1,158 @@
+import re
+import threading
+
+import markdown
+
+try:
+    import markdown_it
+except ImportError:
+    markdown_it = None
+
+try:
+    import mistune
+except ImportError:
+    mistune = None
+
+
+class MarkdownRenderer:
+    """
+    Renders markdown to HTML with the fenced code and tables features. Creating a markdown engine loads its
+    extensions, which costs more than rendering a typical file, so each thread creates one engine and reuses it for
+    every file it renders. Engines are not shared between threads, as they keep state while rendering.
+
+    Renderers are shared within a process, see get(). When a renderer is pickled, such as when sent to a process pool
+    worker, it is restored as the shared renderer of the receiving process.
+
+    The "markdown" backend (Python-Markdown) is the default. "markdown-it" (markdown-it-py) and "mistune" are faster,
+    but follow CommonMark more closely, so their output can differ for some documents. Use find_differences() to
+    check a backend against real content before switching to it.
+    """
+
+    # Supported backends, and the library each one needs
+    BACKENDS = {
+        'markdown': 'markdown',
+        'markdown-it': 'markdown-it-py',
+        'mistune': 'mistune',
+    }
+
+    # Documents covering the supported features, used to check backends against each other
+    SAMPLES = [
+        '# Title\n\nSome *emphasis*, **strong** text and a [link](https://example.com).',
+        '```python\nprint("<hello>")\n```',
+        '```\nplain code\n```\n\nA paragraph after code.',
+        '| Name | Value |\n| ---- | ----- |\n| a | 1 |\n| b | 2 |',
+        '| Left | Right |\n| :--- | ----: |\n| a | 1 |',
+        '- one\n- two',
+    ]
+
+    # Renderers shared within this process, by backend
+    renderers = {}
+    renderers_lock = threading.Lock()
+
+    def __init__(
+        self,
+        backend: str = 'markdown'
+    ):
+        """
+        Construct the renderer.
+        :param backend: one of "markdown", "markdown-it" or "mistune"
+        """
+        if backend not in MarkdownRenderer.BACKENDS:
+            raise ValueError(
+                f'Unknown markdown renderer "{backend}", must be one of "{list(MarkdownRenderer.BACKENDS)}".')
+
+        if (backend == 'markdown-it' and not markdown_it) or (backend == 'mistune' and not mistune):
+            raise ValueError(
+                f'The markdown renderer "{backend}" needs the "{MarkdownRenderer.BACKENDS[backend]}" library, which is '
+                f'not installed.')
+
+        self.backend = backend
+        self._local = threading.local()
+
+    def render(
+        self,
+        markdown_content: str
+    ) -> str:
+        """
+        Render markdown to HTML, using the engine of the current thread.
+        :param markdown_content:
+        :return:
+        """
+        engine = getattr(self._local, 'engine', None)
+
+        if engine is None:
+            engine = self._local.engine = self.create_engine()
+
+        if self.backend == 'markdown':
+            return engine.reset().convert(markdown_content)
+
+        return engine(markdown_content).rstrip('\n')
+
+    def create_engine(
+        self
+    ) -> any:
+        """
+        Create a markdown engine for the backend. Engines of the faster backends are returned as their render function.
+        :return:
+        """
+        if self.backend == 'markdown-it':
+            return markdown_it.MarkdownIt('commonmark').enable('table').render
+
+        if self.backend == 'mistune':
+            return mistune.create_markdown(escape=False, plugins=['table'])
+
+        return markdown.Markdown(extensions=['fenced_code', 'tables'])
+
+    def find_differences(
+        self,
+        documents: list = None,
+        reference: str = 'markdown'
+    ) -> list:
+        """
+        Render some documents with this renderer and a reference backend, returning the documents whose HTML differs.
+        Whitespace between tags is ignored. The built-in samples are used if no documents are provided.
+        :param documents:
+        :param reference:
+        :return:
+        """
+        reference_renderer = MarkdownRenderer.get(reference)
+
+        return [
+            document for document in (documents if documents is not None else MarkdownRenderer.SAMPLES)
+            if MarkdownRenderer.normalize(self.render(document)) !=
+            MarkdownRenderer.normalize(reference_renderer.render(document))]
+
+    @staticmethod
+    def get(
+        backend: str = 'markdown'
+    ):
+        """
+        Get the renderer of a backend shared within this process, creating it if needed.
+        :param backend:
+        :return:
+        """
+        with MarkdownRenderer.renderers_lock:
+            if backend not in MarkdownRenderer.renderers:
+                MarkdownRenderer.renderers[backend] = MarkdownRenderer(backend)
+
+            return MarkdownRenderer.renderers[backend]
+
+    @staticmethod
+    def normalize(
+        html: str
+    ) -> str:
+        """
+        Normalize HTML for comparison, removing whitespace between tags and within inline styles.
+        :param html:
+        :return:
+        """
+        html = re.sub(r'>\s+<', '><', html.strip())
+        return re.sub(r'style="[^"]*"', lambda match: re.sub(r'[\s;]', '', match[0]), html)
+
+    def __reduce__(
+        self
+    ):
+        """
+        Restore the renderer as the shared renderer of the receiving process, its engines are not pickled.
+        """
+        return MarkdownRenderer.get, (self.backend,)
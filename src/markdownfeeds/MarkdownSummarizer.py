@@ -0,0 +1,180 @@
+import html
+import re
+
+import html2text
+
+
+class MarkdownSummarizer:
+    """
+    Generates the plain text summary of a markdown file, truncated to a maximum length.
+
+    The "markdown" engine strips markdown syntax from the body line by line, and stops reading as soon as it has
+    enough text, so the cost does not grow with the length of the body. Fenced code blocks, table delimiter rows, html
+    blocks and link reference definitions are left out of the summary. The "html" engine converts the rendered html of
+    the whole body to text with html2text, as older versions did.
+
+    Summaries can be truncated at any character (the default), at a word boundary or at a sentence boundary. Truncated
+    summaries end with "..", except when truncated at the end of a sentence.
+    """
+
+    # Supported engines and truncation modes
+    ENGINES = ['markdown', 'html']
+    TRUNCATIONS = ['character', 'word', 'sentence']
+
+    # Block level syntax at the start of a line
+    FENCE_PATTERN = re.compile(r'^ {0,3}(`{3,}|~{3,})')
+    SKIPPED_LINE_PATTERN = re.compile(
+        r'^ {0,3}(?:\[[^\]]+\]:\s|<|\|?\s*:?-+:?\s*(?:\|\s*:?-+:?\s*)*\|?\s*$|(?:[-*_]\s*){3,}$|={2,}\s*$)')
+    LINE_PREFIX_PATTERN = re.compile(r'^\s*(?:>\s*)*(?:#{1,6}\s+|[-*+]\s+(?:\[[ xX]\]\s+)?|\d+[.)]\s+)?')
+
+    # Inline syntax, applied in order
+    INLINE_PATTERNS = [
+        (re.compile(r'!\[([^\]]*)\]\([^)]*\)'), r'\1'),
+        (re.compile(r'\[([^\]]*)\](?:\([^)]*\)|\[[^\]]*\])'), r'\1'),
+        (re.compile(r'<[^>\n]+>'), ''),
+        (re.compile(r'(`+)(.+?)\1'), r'\2'),
+        (re.compile(r'(\*{1,3})(?=\S)(.+?)(?<=\S)\1'), r'\2'),
+        (re.compile(r'(?<!\w)(_{1,3})(?=\S)(.+?)(?<=\S)\1(?!\w)'), r'\2'),
+        (re.compile(r'~~(.+?)~~'), r'\1'),
+        (re.compile(r'\s+#+\s*$'), ''),
+        (re.compile(r'\|'), ' '),
+        (re.compile(r'\\([\\`*_{}\[\]()#+\-.!|~>])'), r'\1'),
+    ]
+
+    # The end of a sentence, within a summary
+    SENTENCE_END_PATTERN = re.compile(r'[.!?](?=\s|$)')
+
+    def __init__(
+        self,
+        max_length: int = 100,
+        truncate: str = 'character',
+        engine: str = 'markdown'
+    ):
+        """
+        Construct the summarizer.
+        :param max_length: maximum number of characters in a summary, before the ".." suffix
+        :param truncate: one of "character", "word" or "sentence"
+        :param engine: one of "markdown" or "html"
+        """
+        if truncate not in MarkdownSummarizer.TRUNCATIONS:
+            raise ValueError(
+                f'Unknown summary truncation "{truncate}", must be one of "{MarkdownSummarizer.TRUNCATIONS}".')
+
+        if engine not in MarkdownSummarizer.ENGINES:
+            raise ValueError(f'Unknown summary engine "{engine}", must be one of "{MarkdownSummarizer.ENGINES}".')
+
+        self.max_length = max_length
+        self.truncate = truncate
+        self.engine = engine
+
+    @property
+    def key(
+        self
+    ) -> tuple:
+        """
+        Return a key describing the summaries this summarizer generates.
+        :return:
+        """
+        return self.engine, self.max_length, self.truncate
+
+    def summarize(
+        self,
+        markdown_content: str,
+        render_html=None
+    ) -> str:
+        """
+        Generate the summary of some markdown content.
+        :param markdown_content:
+        :param render_html: function returning the rendered html of the content, used by the "html" engine
+        :return:
+        """
+        if self.engine == 'html':
+            return self.shorten(html2text.html2text(render_html() if render_html else markdown_content))
+
+        return self.shorten(self.extract_text(markdown_content))
+
+    def extract_text(
+        self,
+        markdown_content: str
+    ) -> str:
+        """
+        Extract plain text from the start of some markdown content. Reading stops once there is more text than the
+        maximum length, so the rest of the content is never scanned.
+        :param markdown_content:
+        :return:
+        """
+        parts = []
+        length = 0
+        fence = None
+        position = 0
+
+        while position < len(markdown_content) and length <= self.max_length:
+            end = markdown_content.find('\n', position)
+            end = len(markdown_content) if end == -1 else end
+            line = markdown_content[position:end]
+            position = end + 1
+
+            fence_match = MarkdownSummarizer.FENCE_PATTERN.match(line)
+
+            if fence:
+                if fence_match and fence_match[1][0] == fence[0] and len(fence_match[1]) >= len(fence):
+                    fence = None
+
+                continue
+
+            if fence_match:
+                fence = fence_match[1]
+                continue
+
+            if MarkdownSummarizer.SKIPPED_LINE_PATTERN.match(line):
+                continue
+
+            text = MarkdownSummarizer.strip_inline(MarkdownSummarizer.LINE_PREFIX_PATTERN.sub('', line, 1))
+
+            if text:
+                parts.append(text)
+                length += len(text) + 1
+
+        return ' '.join(parts)
+
+    def shorten(
+        self,
+        text: str
+    ) -> str:
+        """
+        Collapse the whitespace of some text and truncate it to the maximum length. The "html" engine only replaces
+        line breaks, as older versions did.
+        :param text:
+        :return:
+        """
+        text = ' '.join(text.split()) if self.engine == 'markdown' else text.replace('\n', ' ')
+
+        if len(text) <= self.max_length:
+            return text.strip()
+
+        shortened = text[:self.max_length]
+
+        if self.truncate == 'sentence':
+            sentence_ends = [match.end() for match in MarkdownSummarizer.SENTENCE_END_PATTERN.finditer(shortened)]
+
+            if sentence_ends:
+                return shortened[:sentence_ends[-1]]
+
+        if self.truncate in ('word', 'sentence') and not text[self.max_length].isspace() and ' ' in shortened:
+            shortened = shortened[:shortened.rindex(' ')]
+
+        return shortened.strip() + '..'
+
+    @staticmethod
+    def strip_inline(
+        text: str
+    ) -> str:
+        """
+        Strip the inline markdown syntax from a line of text, and decode html entities such as "&amp;".
+        :param text:
+        :return:
+        """
+        for pattern, replacement in MarkdownSummarizer.INLINE_PATTERNS:
+            text = pattern.sub(replacement, text)
+
+        return html.unescape(text).strip()
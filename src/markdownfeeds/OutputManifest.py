@@ -0,0 +1,188 @@
+import hashlib
+import json
+import logging
+import os
+import threading
+
+from markdownfeeds import write_to_file
+
+logging = logging.getLogger(__name__)
+
+
+class OutputManifest:
+    """
+    A manifest of the files written by a generator, storing a content hash per target file. It is used to avoid
+    rewriting pages whose content is identical to what is already on disk.
+
+    The manifest can also store a signature per page, describing the inputs the page was built from. If a page's
+    signature has not changed, the page does not need to be built at all.
+    """
+
+    # Bump this when the layout of the manifest changes, older manifests will then be discarded
+    MANIFEST_VERSION = 1
+
+    def __init__(
+        self,
+        manifest_file_path: str = None
+    ):
+        """
+        Construct the output manifest. If no manifest file path is provided, the manifest will only live in memory.
+        :param manifest_file_path:
+        """
+        self.manifest_file_path = manifest_file_path
+        self.files = {}
+        self.pages = {}
+        self.written = 0
+        self.skipped = 0
+        self._lock = threading.Lock()
+
+        if manifest_file_path:
+            self.files, self.pages = OutputManifest.read_manifest(manifest_file_path)
+
+    def write(
+        self,
+        file_path: str,
+        content: str | bytes,
+        encoding: str = 'utf-8',
+        write_file_path: str = None
+    ) -> int:
+        """
+        Write some content to a file, unless the file already contains exactly that content. Returns the number of
+        bytes written, which is 0 if the file was skipped. Content may already be encoded. Safe to call from several
+        threads at once.
+        :param file_path:
+        :param content:
+        :param encoding:
+        :param write_file_path: path to actually write the file to, such as in a staging directory
+        :return:
+        """
+        key = os.path.abspath(file_path)
+        encoded = content if isinstance(content, bytes) else content.encode(encoding)
+        content_hash = hashlib.sha1(encoded).hexdigest()
+
+        if self.is_unchanged(key, content_hash, len(encoded)):
+            with self._lock:
+                self.skipped += 1
+
+            return 0
+
+        write_to_file(write_file_path if write_file_path else file_path, encoded)
+
+        with self._lock:
+            self.files[key] = content_hash
+            self.written += 1
+
+        return len(encoded)
+
+    def is_unchanged(
+        self,
+        key: str,
+        content_hash: str,
+        content_size: int
+    ) -> bool:
+        """
+        Check if a file on disk still matches a content hash. The file must exist and have the expected size, to catch
+        files that have been removed or modified since the manifest was written.
+        :param key:
+        :param content_hash:
+        :param content_size:
+        :return:
+        """
+        if self.files.get(key) != content_hash:
+            return False
+
+        return os.path.isfile(key) and os.path.getsize(key) == content_size
+
+    def has_page(
+        self,
+        file_path: str | None,
+        signature: str
+    ) -> bool:
+        """
+        Check if a page was last built from inputs with the provided signature and is still on disk.
+        :param file_path:
+        :param signature:
+        :return:
+        """
+        if not file_path:
+            return False
+
+        key = os.path.abspath(file_path)
+
+        return self.pages.get(key) == signature and key in self.files and os.path.isfile(key)
+
+    def set_page(
+        self,
+        file_path: str | None,
+        signature: str
+    ) -> None:
+        """
+        Record the signature of the inputs a page was built from.
+        :param file_path:
+        :param signature:
+        :return:
+        """
+        if file_path:
+            self.pages[os.path.abspath(file_path)] = signature
+
+    def skip_page(
+        self
+    ) -> None:
+        """
+        Record that a page was skipped without being built.
+        :return:
+        """
+        with self._lock:
+            self.skipped += 1
+
+    def reset_counters(
+        self
+    ) -> None:
+        """
+        Reset the written and skipped counters, ready for a new run.
+        :return:
+        """
+        self.written = 0
+        self.skipped = 0
+
+    def save(
+        self
+    ) -> None:
+        """
+        Persist the manifest to disk.
+        :return:
+        """
+        if not self.manifest_file_path:
+            return
+
+        write_to_file(
+            self.manifest_file_path,
+            json.dumps(
+                {'version': OutputManifest.MANIFEST_VERSION, 'files': self.files, 'pages': self.pages},
+                indent=2, sort_keys=True))
+
+    @staticmethod
+    def read_manifest(
+        manifest_file_path: str
+    ) -> (dict, dict):
+        """
+        Read the file hashes and page signatures from a manifest on disk. A missing, unreadable or outdated manifest is
+        treated as empty.
+        :param manifest_file_path:
+        :return:
+        """
+        if not os.path.isfile(manifest_file_path):
+            return {}, {}
+
+        try:
+            with open(manifest_file_path, encoding='utf-8') as file:
+                manifest = json.load(file)
+        except (OSError, ValueError) as error:
+            logging.warning(f'Ignoring unreadable output manifest "{manifest_file_path}": {error}')
+            return {}, {}
+
+        if type(manifest) is not dict or manifest.get('version') != OutputManifest.MANIFEST_VERSION:
+            logging.info(f'Ignoring outdated output manifest "{manifest_file_path}".')
+            return {}, {}
+
+        return manifest['files'], manifest.get('pages', {})
@@ -0,0 +1,111 @@
+import gzip
+import logging
+import os
+
+from markdownfeeds import write_to_file
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logging = logging.getLogger(__name__)
+
+
+class PageCompressor:
+    """
+    Writes precompressed siblings of exported pages, such as "feed.json.gz" and "feed.json.br", so static hosts can
+    serve compressed pages without compressing them on every request. Output is deterministic, so unchanged pages
+    always compress to the same bytes.
+    """
+
+    # File extension of each compression format
+    EXTENSIONS = {
+        'gzip': '.gz',
+        'brotli': '.br',
+    }
+
+    # Highest compression levels, pages are compressed once and served many times
+    GZIP_LEVEL = 9
+    BROTLI_QUALITY = 11
+
+    def __init__(
+        self,
+        formats: list
+    ):
+        """
+        Construct the page compressor. Brotli is skipped with a warning if the brotli library is not installed.
+        :param formats: compression formats, "gzip" and/or "brotli"
+        """
+        unknown_formats = [compression for compression in formats if compression not in PageCompressor.EXTENSIONS]
+
+        if unknown_formats:
+            raise ValueError(
+                f'Unknown compression formats "{unknown_formats}", must be in "{list(PageCompressor.EXTENSIONS)}".')
+
+        if 'brotli' in formats and not brotli:
+            logging.warning('Not writing brotli compressed pages, the "brotli" library is not installed.')
+            formats = [compression for compression in formats if compression != 'brotli']
+
+        self.formats = list(formats)
+
+    def compress(
+        self,
+        file_path: str,
+        content: bytes
+    ) -> int:
+        """
+        Write a compressed sibling of a page in each format, returning the number of bytes written.
+        :param file_path:
+        :param content:
+        :return:
+        """
+        bytes_written = 0
+
+        for compression in self.formats:
+            compressed = PageCompressor.compress_content(compression, content)
+            write_to_file(file_path + PageCompressor.EXTENSIONS[compression], compressed)
+            bytes_written += len(compressed)
+
+        return bytes_written
+
+    def is_compressed(
+        self,
+        file_path: str
+    ) -> bool:
+        """
+        Check if every compressed sibling of a page exists and is at least as new as the page.
+        :param file_path:
+        :return:
+        """
+        if not os.path.isfile(file_path):
+            return False
+
+        modified_time = os.stat(file_path).st_mtime_ns
+
+        for compression in self.formats:
+            sibling_file_path = file_path + PageCompressor.EXTENSIONS[compression]
+
+            if not os.path.isfile(sibling_file_path) or os.stat(sibling_file_path).st_mtime_ns < modified_time:
+                return False
+
+        return True
+
+    @staticmethod
+    def compress_content(
+        compression: str,
+        content: bytes
+    ) -> bytes:
+        """
+        Compress some content. Gzip output has no timestamp, so it only depends on the content.
+        :param compression:
+        :param content:
+        :return:
+        """
+        if compression == 'gzip':
+            return gzip.compress(content, PageCompressor.GZIP_LEVEL, mtime=0)
+
+        if compression == 'brotli':
+            return brotli.compress(content, quality=PageCompressor.BROTLI_QUALITY)
+
+        raise ValueError(f'Unknown compression format "{compression}".')
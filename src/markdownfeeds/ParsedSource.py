@@ -0,0 +1,37 @@
+from markdownfeeds.MarkdownFile import MarkdownFile
+
+
+class ParsedSource:
+    """
+    The markdown files discovered and parsed once from a source directory, so they can be shared by several
+    generators. Each generator gets its own copy of a markdown file, so processing it does not affect other generators.
+    """
+
+    def __init__(
+        self,
+        file_paths: list,
+        markdown_files: dict
+    ):
+        """
+        Construct the parsed source.
+        :param file_paths: every file path discovered in the source directory
+        :param markdown_files: the parsed markdown files, keyed by file path
+        """
+        self.file_paths = file_paths
+        self.markdown_files = markdown_files
+
+    def get(
+        self,
+        file_path: str
+    ) -> MarkdownFile | None:
+        """
+        Get a copy of the parsed markdown file at a file path, or None if it was not parsed.
+        :param file_path:
+        :return:
+        """
+        markdown_file = self.markdown_files.get(file_path)
+
+        if markdown_file is None:
+            return None
+
+        return markdown_file.copy()
@@ -0,0 +1,224 @@
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from markdownfeeds import write_to_file
+
+logging = logging.getLogger(__name__)
+
+
+class RemoteSource:
+    """
+    A source of markdown files hosted over HTTP. Files are downloaded into a local cache directory, which generators
+    then read like any other source directory.
+
+    Downloads run concurrently, with a bound, over a pooled session. The ETag and Last-Modified headers of each
+    response are kept in an index within the cache directory, so repeat syncs make conditional requests and only
+    download files that have changed. Unchanged files are never rewritten, so their modification times, and with them
+    the build cache and output manifest, stay valid between builds.
+    """
+
+    # Name of the index file kept in the cache directory
+    INDEX_FILE_NAME = '.remote-source.json'
+
+    # Bump this when the layout of the index changes, older indexes will then be discarded
+    INDEX_VERSION = 1
+
+    def __init__(
+        self,
+        urls: list,
+        cache_directory: str,
+        concurrency: int = 8,
+        timeout: float = 30,
+        headers: dict = None,
+        session: requests.Session = None
+    ):
+        """
+        Construct the remote source.
+        :param urls: urls of the markdown files, in the order they should be discovered
+        :param cache_directory: directory the markdown files are downloaded to
+        :param concurrency: maximum number of downloads at once
+        :param timeout: seconds to wait for a server to respond
+        :param headers: extra headers sent with every request, such as authorization
+        :param session: session to make requests with, a pooled session is created by default
+        """
+        self.urls = list(dict.fromkeys(urls))
+        self.cache_directory = cache_directory
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.headers = headers if headers else {}
+        self.session = session if session else RemoteSource.create_session(concurrency)
+        self.downloaded = 0
+        self.not_modified = 0
+        self._lock = threading.Lock()
+
+    def sync(
+        self
+    ) -> [str]:
+        """
+        Bring the cache directory up-to-date with the remote markdown files, returning the path of each local file in
+        the order of the urls. Files whose urls are no longer listed are removed.
+        :return:
+        """
+        index = self.read_index()
+        self.downloaded = 0
+        self.not_modified = 0
+
+        with ThreadPoolExecutor(self.concurrency) as ex:
+            entries = list(ex.map(lambda url: self.fetch(url, index.get(url)), self.urls))
+
+        updated_index = dict(zip(self.urls, entries))
+        self.prune(index, updated_index)
+
+        write_to_file(
+            os.path.join(self.cache_directory, RemoteSource.INDEX_FILE_NAME),
+            json.dumps({'version': RemoteSource.INDEX_VERSION, 'entries': updated_index}, indent=2, sort_keys=True))
+
+        logging.info(
+            f'Synced {len(self.urls)} remote markdown files, downloaded {self.downloaded} and '
+            f'{self.not_modified} were not modified.')
+
+        return [os.path.join(self.cache_directory, entry['file_name']) for entry in entries]
+
+    def fetch(
+        self,
+        url: str,
+        entry: dict | None
+    ) -> dict:
+        """
+        Fetch a single markdown file, using a conditional request if it has been fetched before. Returns the index entry
+        of the file.
+        :param url:
+        :param entry: index entry from the previous sync, if any
+        :return:
+        """
+        file_name = RemoteSource.get_file_name(url)
+        file_path = os.path.join(self.cache_directory, file_name)
+        headers = dict(self.headers)
+
+        if entry and os.path.isfile(file_path):
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+
+        response = self.session.get(url, headers=headers, timeout=self.timeout)
+
+        if response.status_code == 304 and ('If-None-Match' in headers or 'If-Modified-Since' in headers):
+            with self._lock:
+                self.not_modified += 1
+
+            logging.debug(f'Remote markdown file "{url}" was not modified.')
+            return entry
+
+        response.raise_for_status()
+
+        # Servers without validators always send the full file, only rewrite it if it has actually changed
+        if not os.path.isfile(file_path) or RemoteSource.read_bytes(file_path) != response.content:
+            write_to_file(file_path, response.content)
+
+        with self._lock:
+            self.downloaded += 1
+
+        logging.debug(f'Downloaded remote markdown file "{url}".')
+
+        return {
+            'file_name': file_name,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+        }
+
+    def prune(
+        self,
+        index: dict,
+        updated_index: dict
+    ) -> None:
+        """
+        Remove the local files of urls that are no longer part of the source.
+        :param index:
+        :param updated_index:
+        :return:
+        """
+        for url in index.keys() - updated_index.keys():
+            file_path = os.path.join(self.cache_directory, index[url]['file_name'])
+
+            if os.path.isfile(file_path):
+                os.remove(file_path)
+
+            if os.path.isdir(os.path.dirname(file_path)) and not os.listdir(os.path.dirname(file_path)):
+                os.rmdir(os.path.dirname(file_path))
+
+    def read_index(
+        self
+    ) -> dict:
+        """
+        Read the index of the previous sync. A missing, unreadable or outdated index is treated as empty.
+        :return:
+        """
+        index_file_path = os.path.join(self.cache_directory, RemoteSource.INDEX_FILE_NAME)
+
+        if not os.path.isfile(index_file_path):
+            return {}
+
+        try:
+            with open(index_file_path, encoding='utf-8') as file:
+                index = json.load(file)
+        except (OSError, ValueError) as error:
+            logging.warning(f'Ignoring unreadable remote source index "{index_file_path}": {error}')
+            return {}
+
+        if type(index) is not dict or index.get('version') != RemoteSource.INDEX_VERSION:
+            return {}
+
+        return index['entries']
+
+    @staticmethod
+    def get_file_name(
+        url: str
+    ) -> str:
+        """
+        Get the path of the local file a url is downloaded to, relative to the cache directory. Each url gets its own
+        directory, so the file keeps the name from the url, which may hold the date of the post.
+        :param url:
+        :return:
+        """
+        name = re.sub(r'[^A-Za-z0-9._-]', '-', os.path.basename(urlparse(url).path)) or 'index'
+        name = name if name.endswith('.md') else f'{name}.md'
+
+        return os.path.join(hashlib.sha1(url.encode('utf-8')).hexdigest()[:16], name)
+
+    @staticmethod
+    def create_session(
+        pool_size: int
+    ) -> requests.Session:
+        """
+        Create a session with a connection pool large enough for every concurrent download.
+        :param pool_size:
+        :return:
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    @staticmethod
+    def read_bytes(
+        file_path: str
+    ) -> bytes:
+        """
+        Read the raw contents of a file.
+        :param file_path:
+        :return:
+        """
+        with open(file_path, 'rb') as file:
+            return file.read()
@@ -0,0 +1,146 @@
+import asyncio
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable
+
+
+class Scheduler:
+    """
+    A scheduler shared by several feed generators, running all of their stage work in a single bounded worker pool
+    and all of their pipelines on a single event loop.
+
+    Work is queued per owner (usually a generator) and dispatched round-robin between owners, so a feed with a large
+    backlog of work cannot starve the others. At most max_workers work items run at once.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = None
+    ):
+        """
+        Construct the scheduler.
+        :param max_workers: maximum number of work items to run at once, defaults to the number of CPUs
+        """
+        self.max_workers = max_workers if max_workers else (os.cpu_count() or 1)
+        self.executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix='markdownfeeds')
+        self.queues = OrderedDict()
+        self.running = 0
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        coroutine
+    ) -> any:
+        """
+        Run a coroutine to completion on the scheduler's event loop.
+        :param coroutine:
+        :return:
+        """
+        return asyncio.run(coroutine)
+
+    def submit(
+        self,
+        owner: any,
+        fn: Callable,
+        *args
+    ) -> Future:
+        """
+        Queue a work item for an owner, returning a future for its result. Safe to call from any thread.
+        :param owner:
+        :param fn:
+        :param args:
+        :return:
+        """
+        future = Future()
+
+        with self._lock:
+            self.queues.setdefault(owner, deque()).append((future, fn, args))
+
+        self._dispatch()
+
+        return future
+
+    async def map(
+        self,
+        owner: any,
+        fn: Callable,
+        work_items: list
+    ) -> list:
+        """
+        Run a function over a list of work items in the worker pool, returning the results in order.
+        :param owner:
+        :param fn:
+        :param work_items:
+        :return:
+        """
+        return list(await asyncio.gather(
+            *[asyncio.wrap_future(self.submit(owner, fn, work_item)) for work_item in work_items]))
+
+    def shutdown(
+        self
+    ) -> None:
+        """
+        Wait for running work to finish and stop the worker pool.
+        :return:
+        """
+        self.executor.shutdown()
+
+    def _dispatch(
+        self
+    ) -> None:
+        """
+        Start queued work items while there are free workers, taking one item from each owner in turn.
+        :return:
+        """
+        with self._lock:
+            while self.running < self.max_workers and self.queues:
+                owner, queue = self.queues.popitem(last=False)
+                future, fn, args = queue.popleft()
+
+                # Move the owner to the back of the line, so every other owner gets a turn first
+                if queue:
+                    self.queues[owner] = queue
+
+                if not future.set_running_or_notify_cancel():
+                    continue
+
+                self.running += 1
+                self.executor.submit(self._run_work_item, future, fn, args)
+
+    def _run_work_item(
+        self,
+        future: Future,
+        fn: Callable,
+        args: tuple
+    ) -> None:
+        """
+        Run a single work item in a worker, then hand the worker to the next queued work item.
+        :param future:
+        :param fn:
+        :param args:
+        :return:
+        """
+        try:
+            result = fn(*args)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+            self._dispatch()
+
+    def __enter__(
+        self
+    ):
+        return self
+
+    def __exit__(
+        self,
+        *args
+    ) -> None:
+        self.shutdown()
@@ -0,0 +1,123 @@
+import logging
+import os
+import shutil
+import time
+
+logging = logging.getLogger(__name__)
+
+
+class StagedPublisher:
+    """
+    Builds a target directory in a staging directory, then publishes it in a single atomic step, so readers never see
+    a partially built target directory.
+
+    Builds are kept in a "<target>.builds" directory next to the target, and the target directory itself becomes a
+    symbolic link to the latest build. Publishing swaps the link with one rename. If the target is still a real
+    directory, it is moved aside the first time a build is published. A directory can not be replaced by a link in one
+    step, so the target briefly does not exist during that first publish, every later publish is atomic.
+
+    Each staging directory starts as a copy of the published build made of hard links, so pages that are unchanged do
+    not need to be written again. Files are always replaced rather than modified in place, so the published build is
+    never affected by the staging directory.
+    """
+
+    def __init__(
+        self,
+        target_directory: str
+    ):
+        """
+        Construct the staged publisher.
+        :param target_directory:
+        """
+        self.target_directory = os.path.abspath(target_directory)
+        self.builds_directory = f'{self.target_directory}.builds'
+        self.staging_directory = None
+
+    def stage(
+        self
+    ) -> str:
+        """
+        Create a new staging directory, seeded with the files of the published build, and return its path.
+        :return:
+        """
+        self.staging_directory = os.path.join(self.builds_directory, str(time.time_ns()))
+
+        if os.path.isdir(self.target_directory):
+            shutil.copytree(
+                os.path.realpath(self.target_directory), self.staging_directory, copy_function=StagedPublisher.link)
+        else:
+            os.makedirs(self.staging_directory)
+
+        logging.info(f'Staging "{self.target_directory}" in "{self.staging_directory}".')
+
+        return self.staging_directory
+
+    def get_staged_file_path(
+        self,
+        file_path: str
+    ) -> str:
+        """
+        Get the path a file within the target directory is written to while staging.
+        :param file_path:
+        :return:
+        """
+        return os.path.join(self.staging_directory, os.path.relpath(os.path.abspath(file_path), self.target_directory))
+
+    def publish(
+        self
+    ) -> None:
+        """
+        Publish the staging directory, by pointing the target directory at it, then remove the previous build.
+        :return:
+        """
+        previous_directory = None
+
+        if os.path.islink(self.target_directory):
+            previous_directory = os.path.realpath(self.target_directory)
+
+        elif os.path.isdir(self.target_directory):
+            logging.warning(
+                f'Replacing the directory "{self.target_directory}" with a link to the published build, it will not '
+                f'exist for a moment. Later publishes are atomic.')
+
+            previous_directory = f'{self.builds_directory}/previous-{time.time_ns()}'
+            os.rename(self.target_directory, previous_directory)
+
+        # Replacing a link with a new link is atomic, readers see either the previous or the new build
+        temporary_link_path = f'{self.target_directory}.{os.getpid()}.link'
+        os.symlink(os.path.relpath(self.staging_directory, os.path.dirname(self.target_directory)), temporary_link_path)
+        os.replace(temporary_link_path, self.target_directory)
+
+        logging.info(f'Published "{self.staging_directory}" to "{self.target_directory}".')
+
+        if previous_directory and os.path.realpath(previous_directory) != os.path.realpath(self.staging_directory):
+            shutil.rmtree(previous_directory, ignore_errors=True)
+
+        self.staging_directory = None
+
+    def discard(
+        self
+    ) -> None:
+        """
+        Remove the staging directory without publishing it, leaving the published build untouched.
+        :return:
+        """
+        if self.staging_directory:
+            shutil.rmtree(self.staging_directory, ignore_errors=True)
+            self.staging_directory = None
+
+    @staticmethod
+    def link(
+        source_file_path: str,
+        target_file_path: str
+    ) -> None:
+        """
+        Link a file into a staging directory, falling back to a copy if hard links are not supported.
+        :param source_file_path:
+        :param target_file_path:
+        :return:
+        """
+        try:
+            os.link(source_file_path, target_file_path)
+        except OSError:
+            shutil.copy2(source_file_path, target_file_path)
@@ -0,0 +1,193 @@
+import logging
+import os
+import threading
+from typing import Callable
+
+from markdownfeeds.BuildCache import BuildCache
+from markdownfeeds.Gatherer import Gatherer
+from markdownfeeds.MarkdownFileDiscovery import MarkdownFileDiscovery
+
+logging = logging.getLogger(__name__)
+
+
+class Watcher:
+    """
+    Watches the source directories of some feed generators, regenerating the feeds whenever markdown files are added,
+    changed or removed. Source directories are polled, so no platform specific file system events are needed.
+
+    Bursts of changes, such as an editor saving several files, are debounced into a single rebuild. Generators are
+    kept between rebuilds, along with their build caches and output manifests, so each rebuild only parses changed
+    files and only rewrites pages whose content has changed. Generators without a build cache are given an in-memory
+    one.
+    """
+
+    def __init__(
+        self,
+        generators: list,
+        poll_interval: float = .5,
+        debounce: float = .3,
+        max_workers: int = None,
+        on_build: Callable = None
+    ):
+        """
+        Construct the watcher.
+        :param generators: feed generators to keep up to date
+        :param poll_interval: seconds between each poll of the source directories
+        :param debounce: seconds the source directories must be unchanged for before rebuilding
+        :param max_workers: maximum number of work items to run at once, see Gatherer
+        :param on_build: called as on_build(run_results, changed_file_paths) after each rebuild
+        """
+        self.generators = generators
+        self.poll_interval = poll_interval
+        self.debounce = debounce
+        self.max_workers = max_workers
+        self.on_build = on_build
+        self._stop_event = threading.Event()
+
+        [Watcher.warm(generator) for generator in generators]
+
+    def watch(
+        self,
+        max_builds: int = None
+    ) -> None:
+        """
+        Build the feeds, then rebuild them after every change to the source directories, until stopped or until
+        max_builds builds have been run.
+        :param max_builds:
+        :return:
+        """
+        self._stop_event.clear()
+
+        snapshot = self.snapshot()
+        self.build(set(snapshot))
+        builds = 1
+
+        logging.info(f'Watching {len(snapshot)} markdown files for changes.')
+
+        while not self._stop_event.is_set() and (max_builds is None or builds < max_builds):
+            changes = self.wait_for_changes(snapshot)
+
+            if changes is None:
+                break
+
+            snapshot, changed_file_paths = changes
+            self.build(changed_file_paths)
+            builds += 1
+
+    def stop(
+        self
+    ) -> None:
+        """
+        Stop watching, safe to call from another thread or an on_build callback.
+        :return:
+        """
+        self._stop_event.set()
+
+    def build(
+        self,
+        changed_file_paths: set
+    ) -> list | None:
+        """
+        Regenerate every feed. Errors are logged rather than raised, so a file saved part way through an edit does not
+        stop the watcher. Returns the run results, or None if the build failed.
+        :param changed_file_paths:
+        :return:
+        """
+        logging.info(f'Regenerating feeds after {len(changed_file_paths)} markdown files changed.')
+
+        try:
+            run_results = Gatherer(self.generators, max_workers=self.max_workers).generate()
+        except Exception:
+            logging.exception('Failed to regenerate feeds, waiting for the next change.')
+            return None
+
+        if self.on_build:
+            self.on_build(run_results, changed_file_paths)
+
+        return run_results
+
+    def wait_for_changes(
+        self,
+        snapshot: dict
+    ) -> tuple | None:
+        """
+        Poll the source directories until they change, then until they have been unchanged for the debounce period.
+        Returns the new snapshot and the paths of the added, changed and removed files, or None if stopped.
+        :param snapshot:
+        :return:
+        """
+        while not self._stop_event.wait(self.poll_interval):
+            current_snapshot = self.snapshot()
+
+            if current_snapshot == snapshot:
+                continue
+
+            while not self._stop_event.wait(self.debounce):
+                latest_snapshot = self.snapshot()
+
+                if latest_snapshot == current_snapshot:
+                    return current_snapshot, Watcher.diff(snapshot, current_snapshot)
+
+                current_snapshot = latest_snapshot
+
+        return None
+
+    def snapshot(
+        self
+    ) -> dict:
+        """
+        Take a snapshot of the modification time and size of every markdown file in the watched source directories.
+        Remote sources are not watched.
+        :return:
+        """
+        snapshot = {}
+
+        for settings in {Gatherer.get_source_key(generator): generator.generator_settings
+                         for generator in self.generators}.values():
+            # Remote sources are synced on every build rather than watched
+            if settings.get('source_urls'):
+                continue
+
+            discovery = MarkdownFileDiscovery(
+                settings.get('source_directory'),
+                settings.get('skip_files'),
+                settings.get('ignore_patterns'),
+                settings.get('use_gitignore'))
+
+            for file_path in discovery.walk():
+                try:
+                    stat = os.stat(file_path)
+                except OSError:
+                    continue
+
+                snapshot[os.path.abspath(file_path)] = (stat.st_mtime_ns, stat.st_size)
+
+        return snapshot
+
+    @staticmethod
+    def diff(
+        snapshot: dict,
+        current_snapshot: dict
+    ) -> set:
+        """
+        Get the paths of the files that were added, changed or removed between two snapshots.
+        :param snapshot:
+        :param current_snapshot:
+        :return:
+        """
+        return {
+            file_path for file_path in snapshot.keys() | current_snapshot.keys()
+            if snapshot.get(file_path) != current_snapshot.get(file_path)
+        }
+
+    @staticmethod
+    def warm(
+        generator
+    ) -> None:
+        """
+        Give a generator an in-memory build cache if it has none, so parsed files are kept between rebuilds.
+        :param generator:
+        :return:
+        """
+        if not generator.build_cache:
+            generator.build_cache = BuildCache()
@@ -1,4 +1,5 @@
 import os
+import threading
 
 import requests
 from requests import Response
@@ -10,7 +11,8 @@ def write_to_file(
     encoding: str = 'utf-8'
 ) -> None:
     """
-    Write some contents to a specific file.
+    Write some contents to a specific file. The contents are written to a temporary file in the same directory, which
+    then replaces the file in a single step, so readers never see a partially written file.
     :param encoding:
     :param file_path:
     :param content:
@@ -18,11 +20,26 @@ def write_to_file(
     """
     dir_path = os.path.dirname(file_path)
 
-    if not os.path.exists(dir_path):
-        os.makedirs(dir_path)
+    if dir_path and not os.path.exists(dir_path):
+        os.makedirs(dir_path, exist_ok=True)
 
-    with open(file_path, 'w', encoding=encoding) as file:
-        file.write(content)
+    temporary_file_path = os.path.join(
+        dir_path, f'.{os.path.basename(file_path)}.{os.getpid()}.{threading.get_ident()}.tmp')
+
+    try:
+        if isinstance(content, bytes):
+            with open(temporary_file_path, 'wb') as file:
+                file.write(content)
+        else:
+            with open(temporary_file_path, 'w', encoding=encoding) as file:
+                file.write(content)
+
+        os.replace(temporary_file_path, file_path)
+    except BaseException:
+        if os.path.exists(temporary_file_path):
+            os.remove(temporary_file_path)
+
+        raise
 
 
 def read_from_file(
@@ -44,14 +61,33 @@ def read_from_file(
 
 def read_from_url(
     url: str,
-    bearer_token: str = None
+    bearer_token: str = None,
+    timeout: float = 30,
+    session: requests.Session = None
 ) -> Response:
     """
-    Read from url.
+    Read from url. Requests share a session by default, so connections are reused between calls.
     """
     headers = {}
 
     if bearer_token:
         headers['Authorization'] = f'Bearer {bearer_token}'
 
-    return requests.get(url, headers=headers)
+    return (session if session else get_session()).get(url, headers=headers, timeout=timeout)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """
+    Get the session shared by calls to read_from_url.
+    """
+    global _session
+
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+
+    return _session
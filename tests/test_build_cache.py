@@ -0,0 +1,78 @@
+import os
+
+from markdownfeeds.BuildCache import BuildCache
+from markdownfeeds.Generators import GeneratorSettings
+from markdownfeeds.Generators.Json.JsonFeedGenerator import JsonFeedGenerator
+from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
+from markdownfeeds.MarkdownFile import MarkdownFile
+
+
+class TaggingFeedGenerator(JsonFeedGenerator):
+    def _process_markdown_file(self, markdown_file):
+        markdown_file.front_matter['tags'].append('processed')
+        self.processed_tags.append(list(markdown_file.front_matter['tags']))
+        return markdown_file
+
+
+def write_post(file_path, title, tags='[python]'):
+    with open(file_path, 'w') as file:
+        file.write(f'---\ntitle: {title}\ntags: {tags}\n---\nBody of {title}.\n')
+
+
+def test_processing_changes_are_not_stored_in_the_cache(tmp_path):
+    os.makedirs(tmp_path / 'posts')
+    write_post(tmp_path / 'posts' / 'post.md', 'Post')
+
+    for run in range(3):
+        generator = TaggingFeedGenerator(JsonFeed(title='Feed'), GeneratorSettings(
+            source_directory=str(tmp_path / 'posts'),
+            target_directory=str(tmp_path / 'feed'),
+            cache_file_path=str(tmp_path / 'cache.pickle')))
+        generator.processed_tags = []
+        generator.run_standalone()
+
+        assert generator.processed_tags == [['python', 'processed']]
+        assert generator.build_cache.hits == (1 if run else 0)
+
+
+def test_in_memory_cache_returns_independent_front_matter(tmp_path):
+    file_path = str(tmp_path / 'post.md')
+    write_post(file_path, 'Post')
+
+    build_cache = BuildCache()
+    markdown_file = MarkdownFile.load(file_path)
+    build_cache.store(file_path, markdown_file)
+    markdown_file.front_matter['tags'].append('stored')
+
+    cached_markdown_file = build_cache.load(file_path)
+    cached_markdown_file.front_matter['tags'].append('loaded')
+
+    assert build_cache.load(file_path).front_matter['tags'] == ['python']
+
+
+def test_file_saved_after_it_was_read_is_not_served_from_the_cache(tmp_path):
+    file_path = str(tmp_path / 'post.md')
+    write_post(file_path, 'OLD')
+
+    build_cache = BuildCache()
+    markdown_file = MarkdownFile.load(file_path)
+
+    # The file is saved while the build is still running, before the parsed file is stored
+    write_post(file_path, 'NEW!')
+    build_cache.store(file_path, markdown_file)
+
+    assert build_cache.load(file_path) is None
+    assert build_cache.misses == 1
+
+
+def test_touched_file_with_the_same_contents_is_a_hit(tmp_path):
+    file_path = str(tmp_path / 'post.md')
+    write_post(file_path, 'Post')
+
+    build_cache = BuildCache()
+    build_cache.store(file_path, MarkdownFile.load(file_path))
+
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10 ** 9))
+
+    assert build_cache.load(file_path).front_matter['title'] == 'Post'
@@ -0,0 +1,48 @@
+import datetime
+
+import pytest
+
+from markdownfeeds.DateResolver import DateResolver
+from markdownfeeds.Exceptions import DateParseError
+
+
+def test_native_values_are_used_as_they_are():
+    date_time = datetime.datetime(2024, 1, 31, 8, 30)
+
+    assert DateResolver.resolve(date_time) is date_time
+    assert DateResolver.resolve(datetime.date(2024, 1, 31)) == datetime.datetime(2024, 1, 31)
+
+
+@pytest.mark.parametrize('value, expected', [
+    ('2024-01-31', datetime.datetime(2024, 1, 31)),
+    ('2024-01-31T08:30:00', datetime.datetime(2024, 1, 31, 8, 30)),
+    ('2024-01-31 08:30:00+02:00',
+     datetime.datetime(2024, 1, 31, 8, 30, tzinfo=datetime.timezone(datetime.timedelta(hours=2)))),
+    ('31 January 2024', datetime.datetime(2024, 1, 31)),
+    ('Jan 31, 2024 8:30 AM', datetime.datetime(2024, 1, 31, 8, 30)),
+])
+def test_strings_are_parsed(value, expected):
+    assert DateResolver.resolve(value) == expected
+
+
+def test_file_name_is_used_without_a_front_matter_date():
+    assert DateResolver.resolve(None, 'posts/2024-01-31-my-post.md') == datetime.datetime(2024, 1, 31)
+    assert DateResolver.resolve('2023-05-01', '2024-01-31-my-post.md') == datetime.datetime(2023, 5, 1)
+
+
+def test_missing_date_resolves_to_none():
+    assert DateResolver.resolve(None, 'my-post.md') is None
+
+
+def test_unparseable_string_raises():
+    with pytest.raises(DateParseError):
+        DateResolver.resolve('not a date')
+
+
+def test_unsupported_type_raises():
+    with pytest.raises(TypeError):
+        DateResolver.resolve(['2024-01-31'])
+
+
+def test_parsed_strings_are_cached():
+    assert DateResolver.parse('2024-02-29') is DateResolver.parse('2024-02-29')
@@ -0,0 +1,69 @@
+import datetime
+
+import pytest
+
+from markdownfeeds.FeedSorter import FeedSorter
+from markdownfeeds.MarkdownFile import MarkdownFile
+
+UTC = datetime.timezone.utc
+PLUS_FIVE = datetime.timezone(datetime.timedelta(hours=5))
+
+
+def sort(markdown_files, key, order='asc', limit=None):
+    feed_sorter = FeedSorter(key, order, limit)
+    sort_keys = [feed_sorter.get_sort_key(markdown_file) for markdown_file in markdown_files]
+
+    return [markdown_file.file_path for markdown_file in feed_sorter.sort(markdown_files, sort_keys)]
+
+
+def titled(*titles):
+    return [MarkdownFile(f'{index}.md', {'title': title} if title else {}) for index, title in enumerate(titles)]
+
+
+@pytest.mark.parametrize('order, expected', [('asc', ['1.md', '2.md', '0.md', '3.md']),
+                                             ('desc', ['0.md', '2.md', '1.md', '3.md'])])
+def test_missing_values_are_last_in_both_orders(order, expected):
+    assert sort(titled('c', 'a', 'b', None), 'title', order) == expected
+
+
+def test_equal_values_keep_their_order():
+    assert sort(titled('b', 'a', 'b', 'a'), 'title') == ['1.md', '3.md', '0.md', '2.md']
+    assert sort(titled('b', 'a', 'b', 'a'), 'title', 'desc') == ['0.md', '2.md', '1.md', '3.md']
+
+
+@pytest.mark.parametrize('order, expected', [('asc', ['1.md', '0.md']), ('desc', ['2.md', '0.md'])])
+def test_limit_keeps_the_first_items(order, expected):
+    assert sort(titled('b', 'a', 'c', None), 'title', order, limit=2) == expected
+
+
+def test_date_key_uses_the_file_name_date():
+    markdown_files = [MarkdownFile('2024-02-01-b.md'), MarkdownFile('2024-01-01-a.md'), MarkdownFile('c.md')]
+    assert sort(markdown_files, 'date', 'desc') == ['2024-02-01-b.md', '2024-01-01-a.md', 'c.md']
+
+
+def test_naive_and_aware_dates_are_compared_in_utc():
+    markdown_files = [
+        MarkdownFile('naive.md', {'date': datetime.datetime(2024, 1, 1, 8)}),
+        MarkdownFile('aware.md', {'date': datetime.datetime(2024, 1, 1, 12, tzinfo=PLUS_FIVE)}),
+        MarkdownFile('utc.md', {'date': datetime.datetime(2024, 1, 1, 7, 30, tzinfo=UTC)}),
+        MarkdownFile('date.md', {'date': datetime.date(2024, 1, 1)}),
+    ]
+
+    assert sort(markdown_files, 'date') == ['date.md', 'aware.md', 'utc.md', 'naive.md']
+
+
+def test_mixed_value_types_sort_by_type():
+    markdown_files = [
+        MarkdownFile('string.md', {'rank': 'high'}),
+        MarkdownFile('list.md', {'rank': ['a']}),
+        MarkdownFile('date.md', {'rank': datetime.date(2024, 1, 1)}),
+        MarkdownFile('number.md', {'rank': 2}),
+        MarkdownFile('float.md', {'rank': 1.5}),
+    ]
+
+    assert sort(markdown_files, 'rank') == ['float.md', 'number.md', 'date.md', 'string.md', 'list.md']
+
+
+def test_unknown_order_is_rejected():
+    with pytest.raises(ValueError):
+        FeedSorter('title', 'random')
@@ -0,0 +1,56 @@
+import pytest
+
+from markdownfeeds.FrontMatter import FrontMatter
+
+
+@pytest.mark.parametrize('content, front_matter, body', [
+    ('---\ntitle: A\n---\nBody', 'title: A\n', 'Body'),
+    ('---\r\ntitle: A\r\n---\r\nBody', 'title: A\r\n', 'Body'),
+    ('\ufeff---\ntitle: A\n---\nBody', 'title: A\n', 'Body'),
+    ('\n  \n---\ntitle: A\n---\nBody', 'title: A\n', 'Body'),
+    ('---\ntitle: A\n...\nBody', 'title: A\n', 'Body'),
+    ('---  \ntitle: A\n---\t\nBody', 'title: A\n', 'Body'),
+    ('---\ntitle: A\n---', 'title: A\n', ''),
+    ('---\n---\nBody', '', 'Body'),
+])
+def test_split(content, front_matter, body):
+    assert FrontMatter.split(content) == (front_matter, body)
+
+
+def test_delimiters_within_values_and_body_do_not_end_the_front_matter():
+    content = '---\ntitle: A---B\nnote: "---"\n---\nBody\n---\nMore'
+    assert FrontMatter.split(content) == ('title: A---B\nnote: "---"\n', 'Body\n---\nMore')
+
+
+@pytest.mark.parametrize('content', [
+    'Body only',
+    'Intro\n---\ntitle: A\n---\n',
+    '---\ntitle: A\n',
+    '---title: A\n---\n',
+])
+def test_split_without_front_matter(content):
+    assert FrontMatter.split(content) is None
+
+
+def test_partial_split_needs_a_complete_closing_line():
+    assert FrontMatter.split('---\ntitle: A\n---', partial=True) is None
+    assert FrontMatter.split('---\ntitle: A\n---\n', partial=True) == ('title: A\n', '')
+
+
+def test_parse():
+    assert FrontMatter.parse('title: A\ntags: [a, b]\n') == {'title': 'A', 'tags': ['a', 'b']}
+
+
+@pytest.mark.parametrize('block_size', [1, 7, 4096])
+def test_read_header_reads_only_the_front_matter(tmp_path, block_size):
+    file_path = tmp_path / 'post.md'
+    file_path.write_text('---\ntitle: A\n---\n' + 'Body\n' * 1000)
+
+    assert FrontMatter.read_header(str(file_path), block_size=block_size) == 'title: A\n'
+
+
+def test_read_header_without_front_matter(tmp_path):
+    file_path = tmp_path / 'post.md'
+    file_path.write_text('Body')
+
+    assert FrontMatter.read_header(str(file_path)) is None
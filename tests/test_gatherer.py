@@ -0,0 +1,37 @@
+import os
+
+from markdownfeeds.Gatherer import Gatherer
+from markdownfeeds.Generators import GeneratorSettings
+from markdownfeeds.Generators.Json.JsonFeedGenerator import JsonFeedGenerator
+from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
+
+
+class TaggingFeedGenerator(JsonFeedGenerator):
+    def _process_markdown_file(self, markdown_file):
+        markdown_file.front_matter['tags'].append('processed')
+        self.processed_tags.append(list(markdown_file.front_matter['tags']))
+        return markdown_file
+
+
+def create_generator(tmp_path, target_directory):
+    generator = TaggingFeedGenerator(JsonFeed(title='Feed'), GeneratorSettings(
+        source_directory=str(tmp_path / 'posts'),
+        target_directory=str(tmp_path / target_directory)))
+    generator.processed_tags = []
+
+    return generator
+
+
+def test_shared_source_gives_each_generator_its_own_front_matter(tmp_path):
+    os.makedirs(tmp_path / 'posts')
+
+    for index in range(10):
+        with open(tmp_path / 'posts' / f'post-{index}.md', 'w') as file:
+            file.write(f'---\ntitle: Post {index}\ntags: [python, {{name: nested}}]\n---\nBody.\n')
+
+    generators = [create_generator(tmp_path, 'json'), create_generator(tmp_path, 'json-copy')]
+    Gatherer(generators).generate()
+
+    for generator in generators:
+        assert len(generator.processed_tags) == 10
+        assert all(tags == ['python', {'name': 'nested'}, 'processed'] for tags in generator.processed_tags)
@@ -0,0 +1,45 @@
+import pytest
+
+from markdownfeeds.Generators.Json.JsonSerializer import JsonSerializer
+from markdownfeeds.Generators.Json.Models.JsonFeedItem import JsonFeedItem
+
+
+def test_protected_keys_are_properties_backed_by_the_store():
+    feed_item = JsonFeedItem(title='Title')
+    feed_item.url = 'https://example.com'
+
+    assert feed_item.title == 'Title'
+    assert feed_item.get('url') == 'https://example.com'
+
+
+def test_plain_attributes_are_not_exported():
+    feed_item = JsonFeedItem(title='Title')
+    feed_item.helper = 'value'
+
+    assert feed_item.helper == 'value'
+    assert not feed_item.has('helper')
+    assert JsonSerializer('json', compact=True).dumps(feed_item) == '{"title":"Title"}'
+
+
+def test_subclass_attributes_behave_the_same():
+    class CustomJsonFeedItem(JsonFeedItem):
+        pass
+
+    feed_item = CustomJsonFeedItem(title='Title')
+    feed_item.helper = 'value'
+
+    assert feed_item.helper == 'value'
+    assert not feed_item.has('helper')
+
+
+def test_custom_keys_are_readable_as_attributes():
+    feed_item = JsonFeedItem(title='Title')
+    feed_item.set('custom', 'value')
+
+    assert feed_item.custom == 'value'
+    assert JsonSerializer('json', compact=True).dumps(feed_item) == '{"title":"Title","_custom":"value"}'
+
+
+def test_missing_custom_attribute_raises():
+    with pytest.raises(AttributeError):
+        JsonFeedItem().missing
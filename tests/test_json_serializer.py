@@ -0,0 +1,46 @@
+import datetime
+import json
+
+import pytest
+
+from markdownfeeds.Generators.Json.JsonSerializer import JsonSerializer, orjson
+from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
+from markdownfeeds.Generators.Json.Models.JsonFeedItem import JsonFeedItem
+
+BACKENDS = ['json'] + (['orjson'] if orjson else [])
+
+
+class GeneratedByJsonFeed(JsonFeed):
+    def dump(self):
+        dumped = super().dump()
+        dumped['_generated_by'] = 'tests'
+        return dumped
+
+
+def create_feed(feed_class=JsonFeed):
+    feed = feed_class(title='Feed')
+    feed.items = [JsonFeedItem(title='Post', tags=['python'])]
+    feed.page = 1
+    feed.total_pages = 1
+    feed.total_items = 1
+
+    return feed
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_feed_is_exported_like_it_is_dumped(backend):
+    feed = create_feed()
+    assert json.loads(JsonSerializer(backend).dump_feed(feed)) == json.loads(json.dumps(feed.dump()))
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_overridden_feed_dump_is_honoured(backend):
+    dumped = json.loads(JsonSerializer(backend).dump_feed(create_feed(GeneratedByJsonFeed)))
+    assert dumped['_generated_by'] == 'tests'
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_dates_are_written_in_iso_format(backend):
+    value = {'date': datetime.date(2024, 3, 1), 'time': datetime.datetime(2024, 3, 1, 8, tzinfo=datetime.timezone.utc)}
+    assert json.loads(JsonSerializer(backend, compact=True).dumps(value)) == {
+        'date': '2024-03-01', 'time': '2024-03-01T08:00:00+00:00'}
@@ -0,0 +1,87 @@
+import os
+import re
+
+import pytest
+
+from markdownfeeds.MarkdownFileDiscovery import MarkdownFileDiscovery
+
+
+def is_ignored(patterns, relative_path, is_directory=False):
+    return MarkdownFileDiscovery.is_ignored(
+        MarkdownFileDiscovery.compile_rules(patterns), relative_path, is_directory)
+
+
+@pytest.mark.parametrize('pattern, path, matches', [
+    ('*.md', 'post.md', True),
+    ('*.md', 'posts/post.md', False),
+    ('post?.md', 'post1.md', True),
+    ('post?.md', 'post/.md', False),
+    ('**/drafts', 'a/b/drafts', True),
+    ('**/drafts', 'drafts', True),
+    ('drafts/**', 'drafts/a/b.md', True),
+    ('[abc].md', 'b.md', True),
+    ('[!abc].md', 'b.md', False),
+    ('[!abc].md', 'd.md', True),
+    (r'\#notes.md', '#notes.md', True),
+    ('a+b.md', 'a+b.md', True),
+])
+def test_translate(pattern, path, matches):
+    assert bool(re.fullmatch(MarkdownFileDiscovery.translate(pattern), path)) == matches
+
+
+def test_compile_rule_skips_blank_lines_and_comments():
+    assert MarkdownFileDiscovery.compile_rule('') is None
+    assert MarkdownFileDiscovery.compile_rule('   ') is None
+    assert MarkdownFileDiscovery.compile_rule('# comment') is None
+
+
+def test_compile_rule_flags():
+    _, negated, directory_only = MarkdownFileDiscovery.compile_rule('!drafts/')
+    assert negated and directory_only
+
+    _, negated, directory_only = MarkdownFileDiscovery.compile_rule('draft.md')
+    assert not negated and not directory_only
+
+
+def test_unanchored_pattern_matches_at_any_depth():
+    assert is_ignored(['draft.md'], 'draft.md')
+    assert is_ignored(['draft.md'], 'a/b/draft.md')
+
+
+def test_anchored_pattern_is_relative_to_its_directory():
+    assert is_ignored(['/draft.md'], 'draft.md')
+    assert not is_ignored(['/draft.md'], 'a/draft.md')
+    assert is_ignored(['a/draft.md'], 'a/draft.md')
+    assert not is_ignored(['a/draft.md'], 'b/a/draft.md')
+
+
+def test_pattern_relative_to_nested_ignore_file():
+    rules = MarkdownFileDiscovery.compile_rules(['/draft.md'], 'posts/')
+
+    assert MarkdownFileDiscovery.is_ignored(rules, 'posts/draft.md', False)
+    assert not MarkdownFileDiscovery.is_ignored(rules, 'draft.md', False)
+
+
+def test_directory_only_pattern_does_not_match_files():
+    assert is_ignored(['drafts/'], 'drafts', is_directory=True)
+    assert not is_ignored(['drafts/'], 'drafts', is_directory=False)
+
+
+def test_last_matching_rule_wins():
+    assert not is_ignored(['*.md', '!keep.md'], 'keep.md')
+    assert is_ignored(['*.md', '!keep.md'], 'other.md')
+    assert is_ignored(['!keep.md', '*.md'], 'keep.md')
+
+
+def test_walk_applies_nested_gitignore_files(tmp_path):
+    for relative_path in ['a.md', 'drafts/b.md', 'posts/c.md', 'posts/d.md', 'posts/e.txt']:
+        (tmp_path / relative_path).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / relative_path).write_text('# Post')
+
+    (tmp_path / '.gitignore').write_text('drafts/\n')
+    (tmp_path / 'posts' / '.gitignore').write_text('d.md\n')
+
+    discovery = MarkdownFileDiscovery(str(tmp_path), use_gitignore=True)
+    found = [os.path.relpath(path, tmp_path) for path in discovery.walk()]
+
+    assert found == ['a.md', os.path.join('posts', 'c.md')]
@@ -0,0 +1,41 @@
+import pickle
+
+import pytest
+
+from markdownfeeds.MarkdownRenderer import MarkdownRenderer
+
+
+@pytest.mark.parametrize('backend, module', [('markdown-it', 'markdown_it'), ('mistune', 'mistune')])
+def test_backend_matches_python_markdown_on_samples(backend, module):
+    pytest.importorskip(module)
+    assert MarkdownRenderer.get(backend).find_differences() == []
+
+
+def test_engine_is_reused_and_reset_between_documents():
+    renderer = MarkdownRenderer('markdown')
+
+    renderer.render('[home]: https://example.com')
+    engine = renderer._local.engine
+
+    # Link references of a previous document must not leak into the next one
+    assert renderer.render('[home]') == '<p>[home]</p>'
+    assert renderer._local.engine is engine
+
+
+def test_find_differences_against_itself_is_empty():
+    assert MarkdownRenderer('markdown').find_differences(['# Title', '- one\n- two']) == []
+
+
+def test_normalize_ignores_whitespace_between_tags():
+    spaced = MarkdownRenderer.normalize('<p>a</p>\n\n<p style="text-align: left;">b</p>')
+    assert spaced == MarkdownRenderer.normalize('<p>a</p><p style="text-align:left">b</p>')
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        MarkdownRenderer('unknown')
+
+
+def test_shared_renderer_is_restored_when_pickled():
+    renderer = MarkdownRenderer.get('markdown')
+    assert pickle.loads(pickle.dumps(renderer)) is renderer
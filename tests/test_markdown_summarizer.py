@@ -0,0 +1,48 @@
+import pytest
+
+from markdownfeeds.MarkdownSummarizer import MarkdownSummarizer
+
+
+@pytest.mark.parametrize('markdown_content, summary', [
+    ('# Title\n\nSome *emphasis* and **strong** text.', 'Title Some emphasis and strong text.'),
+    ('A [link](https://example.com) and ![an image](image.png).', 'A link and an image.'),
+    ('Some `code` and ~~struck~~ _words_.', 'Some code and struck words.'),
+    ('> A quote\n\n- one\n- [x] two\n1. three', 'A quote one two three'),
+    ('Intro\n\n```python\nprint("hidden")\n```\n\nOutro', 'Intro Outro'),
+    ('| a | b |\n| - | - |\n| 1 | 2 |', 'a b 1 2'),
+    ('[ref]: https://example.com\n<div>html</div>\nText', 'Text'),
+    ('Tom &amp; Jerry &lt;3 &copy;', 'Tom & Jerry <3 ©'),
+    ('snake_case\\_name', 'snake_case_name'),
+])
+def test_markdown_engine(markdown_content, summary):
+    assert MarkdownSummarizer().summarize(markdown_content) == summary
+
+
+@pytest.mark.parametrize('truncate, summary', [
+    ('character', 'One sentence. Two wo..'),
+    ('word', 'One sentence. Two..'),
+    ('sentence', 'One sentence.'),
+])
+def test_truncation(truncate, summary):
+    summarizer = MarkdownSummarizer(max_length=20, truncate=truncate)
+    assert summarizer.summarize('One sentence. Two words here.') == summary
+
+
+def test_short_text_is_not_truncated():
+    assert MarkdownSummarizer(max_length=20).summarize('Short text.') == 'Short text.'
+
+
+def test_extract_text_stops_after_the_maximum_length():
+    summarizer = MarkdownSummarizer(max_length=10)
+    assert summarizer.extract_text('one two\n' * 100) == 'one two one two'
+
+
+def test_html_engine_uses_the_rendered_html():
+    summarizer = MarkdownSummarizer(engine='html')
+    assert summarizer.summarize('ignored', lambda: '<p>Rendered &amp; text</p>') == 'Rendered & text'
+
+
+@pytest.mark.parametrize('arguments', [{'truncate': 'line'}, {'engine': 'text'}])
+def test_invalid_settings_are_rejected(arguments):
+    with pytest.raises(ValueError):
+        MarkdownSummarizer(**arguments)
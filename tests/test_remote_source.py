@@ -0,0 +1,135 @@
+import hashlib
+import http.server
+import os
+import threading
+
+import pytest
+
+from markdownfeeds.Gatherer import Gatherer
+from markdownfeeds.Generators import GeneratorSettings
+from markdownfeeds.Generators.Json.JsonFeedGenerator import JsonFeedGenerator
+from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
+from markdownfeeds.RemoteSource import RemoteSource
+
+
+class MarkdownHandler(http.server.BaseHTTPRequestHandler):
+    """
+    Serves the markdown files of its server, with an ETag if the server sends validators.
+    """
+
+    def do_GET(self):
+        content = self.server.files.get(self.path)
+
+        if content is None:
+            self.send_response(404)
+            self.end_headers()
+            return
+
+        etag = f'"{hashlib.sha1(content).hexdigest()}"'
+
+        if self.server.validators and self.headers.get('If-None-Match') == etag:
+            self.server.statuses.append(304)
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.server.statuses.append(200)
+        self.send_response(200)
+
+        if self.server.validators:
+            self.send_header('ETag', etag)
+
+        self.send_header('Content-Length', str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = http.server.ThreadingHTTPServer(('127.0.0.1', 0), MarkdownHandler)
+    server.files = {
+        '/2024-01-01-first.md': b'---\ntitle: First\n---\nFirst post.\n',
+        '/2024-01-02-second.md': b'---\ntitle: Second\n---\nSecond post.\n',
+    }
+    server.validators = True
+    server.statuses = []
+    server.url = f'http://127.0.0.1:{server.server_port}'
+    threading.Thread(target=server.serve_forever, args=(0.01,), daemon=True).start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def get_urls(server):
+    return [server.url + path for path in server.files]
+
+
+def test_files_are_downloaded_then_not_modified(server, tmp_path):
+    remote_source = RemoteSource(get_urls(server), str(tmp_path))
+
+    file_paths = remote_source.sync()
+
+    assert [os.path.basename(file_path) for file_path in file_paths] == ['2024-01-01-first.md', '2024-01-02-second.md']
+    assert (remote_source.downloaded, remote_source.not_modified) == (2, 0)
+
+    with open(file_paths[0], 'rb') as file:
+        assert file.read() == server.files['/2024-01-01-first.md']
+
+    assert remote_source.sync() == file_paths
+    assert (remote_source.downloaded, remote_source.not_modified) == (0, 2)
+    assert server.statuses == [200, 200, 304, 304]
+
+
+def test_unchanged_files_are_not_rewritten(server, tmp_path):
+    server.validators = False
+    remote_source = RemoteSource(get_urls(server), str(tmp_path))
+
+    file_paths = remote_source.sync()
+    modification_times = [os.stat(file_path).st_mtime_ns for file_path in file_paths]
+
+    # Move the files back in time, so a rewrite would always change their modification times
+    for file_path, modification_time in zip(file_paths, modification_times):
+        os.utime(file_path, ns=(modification_time - 10 ** 9, modification_time - 10 ** 9))
+
+    server.files['/2024-01-02-second.md'] = b'---\ntitle: Second\n---\nChanged.\n'
+
+    remote_source.sync()
+
+    assert remote_source.downloaded == 2
+    assert os.stat(file_paths[0]).st_mtime_ns == modification_times[0] - 10 ** 9
+    assert os.stat(file_paths[1]).st_mtime_ns != modification_times[1] - 10 ** 9
+
+
+def test_files_of_removed_urls_are_pruned(server, tmp_path):
+    first_url, second_url = get_urls(server)
+    file_paths = RemoteSource([first_url, second_url], str(tmp_path)).sync()
+
+    assert RemoteSource([first_url], str(tmp_path)).sync() == file_paths[:1]
+    assert os.path.isfile(file_paths[0])
+    assert not os.path.exists(file_paths[1])
+    assert not os.path.exists(os.path.dirname(file_paths[1]))
+
+
+def test_generators_with_the_same_urls_share_a_source(server, tmp_path):
+    def create_generator(target_directory, urls):
+        return JsonFeedGenerator(JsonFeed(title='Feed'), GeneratorSettings(
+            target_directory=str(tmp_path / target_directory),
+            source_urls=urls,
+            source_cache_directory=str(tmp_path / 'cache')))
+
+    generators = [create_generator('first', get_urls(server)), create_generator('second', get_urls(server))]
+
+    assert Gatherer.get_source_key(generators[0]) == Gatherer.get_source_key(generators[1])
+    assert Gatherer.get_source_key(generators[0]) != Gatherer.get_source_key(
+        create_generator('third', get_urls(server)[:1]))
+
+    Gatherer(generators).generate()
+
+    # The shared source is synced once, for both generators
+    assert server.statuses == [200, 200]
+    assert all(os.path.isfile(tmp_path / target_directory / 'feed.json') for target_directory in ('first', 'second'))
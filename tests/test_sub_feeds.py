@@ -0,0 +1,77 @@
+import json
+import os
+
+import pytest
+
+from markdownfeeds.Generators import GeneratorSettings
+from markdownfeeds.Generators.Json.JsonFeedGenerator import JsonFeedGenerator
+from markdownfeeds.Generators.Json.Models.JsonFeed import JsonFeed
+
+
+def write_post(tmp_path, name, title, tags, author='Ann'):
+    os.makedirs(tmp_path / 'posts', exist_ok=True)
+
+    with open(tmp_path / 'posts' / f'{name}.md', 'w', encoding='utf-8') as file:
+        file.write(f'---\ntitle: {title}\nauthor: {author}\ntags: {json.dumps(tags)}\n---\nBody of {title}.\n')
+
+
+def generate(tmp_path, **settings):
+    JsonFeedGenerator(JsonFeed(title='Feed'), GeneratorSettings(
+        source_directory=str(tmp_path / 'posts'),
+        target_directory=str(tmp_path / 'feed'),
+        sub_feed_keys=['tags', 'author'],
+        **settings)).run_standalone()
+
+
+def read_titles(tmp_path, *path):
+    with open(os.path.join(tmp_path, 'feed', *path, 'feed.json'), encoding='utf-8') as file:
+        return [item['title'] for item in json.load(file)['items']]
+
+
+def list_sub_feeds(tmp_path, key):
+    return sorted(os.listdir(os.path.join(tmp_path, 'feed', key)))
+
+
+def test_sub_feeds_are_exported_per_value(tmp_path):
+    write_post(tmp_path, 'a', 'A', ['Python', 'Web'])
+    write_post(tmp_path, 'b', 'B', ['python'], author='Bob')
+    generate(tmp_path, sort_by='title')
+
+    assert list_sub_feeds(tmp_path, 'tags') == ['python', 'web']
+    assert list_sub_feeds(tmp_path, 'author') == ['ann', 'bob']
+    assert read_titles(tmp_path, 'tags', 'python') == ['A', 'B']
+    assert read_titles(tmp_path, 'author', 'bob') == ['B']
+
+
+def test_values_sharing_a_slug_are_merged(tmp_path):
+    write_post(tmp_path, 'a', 'A', ['C#', '日本'])
+    write_post(tmp_path, 'b', 'B', ['C', 'café', '!!!'])
+    generate(tmp_path, sort_by='title')
+
+    assert list_sub_feeds(tmp_path, 'tags') == ['c', 'café', '日本']
+    assert read_titles(tmp_path, 'tags', 'c') == ['A', 'B']
+
+
+def test_sort_limit_applies_per_sub_feed(tmp_path):
+    write_post(tmp_path, 'a', 'A', ['one', 'two'])
+    write_post(tmp_path, 'b', 'B', ['one'])
+    write_post(tmp_path, 'c', 'C', ['two'])
+    generate(tmp_path, sort_by='title', sort_order='desc', sort_limit=1)
+
+    assert read_titles(tmp_path) == ['C']
+    assert read_titles(tmp_path, 'tags', 'one') == ['B']
+    assert read_titles(tmp_path, 'tags', 'two') == ['C']
+
+
+@pytest.mark.parametrize('staged_publish', [False, True])
+def test_sub_feeds_that_are_no_longer_produced_are_removed(tmp_path, staged_publish):
+    write_post(tmp_path, 'a', 'A', ['kept', 'removed'])
+    generate(tmp_path, staged_publish=staged_publish)
+
+    assert list_sub_feeds(tmp_path, 'tags') == ['kept', 'removed']
+
+    write_post(tmp_path, 'a', 'A', ['kept'])
+    generate(tmp_path, staged_publish=staged_publish)
+
+    assert list_sub_feeds(tmp_path, 'tags') == ['kept']
+    assert read_titles(tmp_path, 'tags', 'kept') == ['A']